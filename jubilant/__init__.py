@@ -14,9 +14,15 @@ from ._all_any import (
     any_maintenance,
     any_waiting,
 )
+from ._debug_log import DebugLogStream, LogEntry, parse_debug_log
 from ._juju import CLIError, ConfigValue, Juju, WaitError
+from ._limits import limit_concurrency
+from ._metrics import CommandEvent, Metrics, ParseEvent, SpanEvent, collect_metrics
+from ._poll import DelaySchedule, adaptive_delay, exponential_backoff
+from ._retry import RetryPolicy
 from ._task import Task, TaskError
-from ._test_helpers import temp_model
+from ._test_helpers import ModelPool, ModelReaper, select_controller, temp_model
+from ._transport import RecordingTransport, ReplayTransport, SubprocessTransport, Transport
 from ._version import Version
 from .modeltypes import ModelInfo
 from .secrettypes import RevealedSecret, Secret, SecretURI
@@ -25,18 +31,33 @@ from .unittypes import UnitInfo
 
 __all__ = [
     'CLIError',
+    'CommandEvent',
     'ConfigValue',
+    'DebugLogStream',
+    'DelaySchedule',
     'Juju',
+    'LogEntry',
+    'Metrics',
     'ModelInfo',
+    'ModelPool',
+    'ModelReaper',
+    'ParseEvent',
+    'RecordingTransport',
+    'ReplayTransport',
+    'RetryPolicy',
     'RevealedSecret',
     'Secret',
     'SecretURI',
+    'SpanEvent',
     'Status',
+    'SubprocessTransport',
     'Task',
     'TaskError',
+    'Transport',
     'UnitInfo',
     'Version',
     'WaitError',
+    'adaptive_delay',
     'all_active',
     'all_agents_idle',
     'all_blocked',
@@ -48,8 +69,13 @@ __all__ = [
     'any_error',
     'any_maintenance',
     'any_waiting',
+    'collect_metrics',
+    'exponential_backoff',
+    'limit_concurrency',
     'modeltypes',
+    'parse_debug_log',
     'secrettypes',
+    'select_controller',
     'statustypes',
     'temp_model',
     'unittypes',
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+import re
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+
+# Lines look like "unit-mysql-0: 14:20:04 INFO juju.worker.uniter found queued "start" hook",
+# optionally with a date before the time (debug-log --date) and milliseconds (--ms).
+_LOG_LINE_RE = re.compile(
+    r'^(?P<entity>\S+): '
+    r'(?P<timestamp>(?:\d{4}-\d{2}-\d{2} )?\d{2}:\d{2}:\d{2}(?:\.\d+)?) '
+    r'(?P<level>[A-Z]+) '
+    r'(?P<module>\S+)'
+    r'(?: (?P<message>.*))?$'
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LogEntry:
+    """A single parsed message from ``juju debug-log``; see :func:`parse_debug_log`."""
+
+    entity: str
+    """Entity that logged the message, for example ``unit-mysql-0`` or ``machine-0``."""
+
+    timestamp: str
+    """Time the message was logged, for example ``14:20:04`` or ``2025-01-02 14:20:04``."""
+
+    level: str
+    """Log level, for example ``INFO`` or ``ERROR``."""
+
+    module: str
+    """Module that logged the message, for example ``juju.worker.uniter``."""
+
+    message: str
+    """The message itself. Multi-line messages, such as tracebacks, include newlines."""
+
+
+def parse_debug_log(lines: str | Iterable[str]) -> list[LogEntry]:
+    """Parse debug log output, for example from :meth:`Juju.debug_log`, into log entries.
+
+    Lines that don't start a new entry (such as the lines of a traceback) are appended to the
+    previous entry's message. Lines before the first entry are ignored.
+
+    Args:
+        lines: Debug log output as a single string, or an iterable of lines (for example,
+            from :meth:`DebugLogStream.recent`).
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    entries: list[LogEntry] = []
+    for line in lines:
+        line = line.rstrip('\n')
+        match = _LOG_LINE_RE.match(line)
+        if match is not None:
+            entries.append(
+                LogEntry(
+                    entity=match['entity'],
+                    timestamp=match['timestamp'],
+                    level=match['level'],
+                    module=match['module'],
+                    message=match['message'] or '',
+                )
+            )
+        elif entries:
+            entry = entries[-1]
+            entries[-1] = dataclasses.replace(entry, message=entry.message + '\n' + line)
+    return entries
+
+
+class DebugLogStream:
+    """Long-lived ``juju debug-log --tail`` process, returned by :meth:`Juju.debug_log_stream`.
+
+    A background thread reads log lines as Juju emits them. Iterate over the stream to receive
+    each line (without the trailing newline) as it arrives, and use :meth:`recent` to get the
+    most recent lines at any time. Memory use is bounded by *keep*: the stream retains at most
+    *keep* recent lines, and if the iterating code falls more than *keep* lines behind, the
+    oldest unread lines are dropped (and counted in :attr:`dropped`).
+
+    Use the stream as a context manager, or call :meth:`close`, to stop the process.
+    """
+
+    def __init__(self, args: list[str], keep: int):
+        if keep < 1:
+            raise ValueError(f'keep must be at least 1, not {keep}')
+        self.dropped = 0
+        """Number of lines dropped because the iterating code fell too far behind."""
+
+        self._keep = keep
+        self._recent: collections.deque[str] = collections.deque(maxlen=keep)
+        self._unread: collections.deque[str] = collections.deque()
+        self._done = False
+        self._cond = threading.Condition()
+        self._process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding='utf-8',
+        )
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> DebugLogStream:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield log lines as they arrive, until the process exits or is closed."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._unread or self._done)
+                if not self._unread:
+                    return
+                line = self._unread.popleft()
+            yield line
+
+    @property
+    def running(self) -> bool:
+        """Whether the ``juju debug-log`` process is still running."""
+        return self._process.poll() is None
+
+    def recent(self) -> list[str]:
+        """Return the most recent log lines received, oldest first (at most *keep* lines)."""
+        with self._cond:
+            return list(self._recent)
+
+    def close(self) -> None:
+        """Stop the process and wait for it to exit."""
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        self._thread.join(timeout=5)
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+    def _read(self) -> None:
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            line = line.rstrip('\n')
+            with self._cond:
+                self._recent.append(line)
+                if len(self._unread) >= self._keep:
+                    # The reader has fallen behind; drop the oldest unread line to bound memory.
+                    self._unread.popleft()
+                    self.dropped += 1
+                self._unread.append(line)
+                self._cond.notify_all()
+        self._process.wait()
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
@@ -1,25 +1,32 @@
 from __future__ import annotations
 
 import contextlib
+import dataclasses
 import functools
-import json
 import logging
 import os
 import pathlib
+import queue
+import re
 import shlex
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 from collections.abc import Callable, Generator, Iterable, Mapping
 from typing import Any, Literal, overload
 
-from . import _pretty, _yaml
+from . import _json, _limits, _metrics, _poll, _pretty, _staging, _yaml
+from ._debug_log import DebugLogStream
+from ._poll import DelaySchedule
+from ._retry import RetryPolicy
 from ._task import Task
+from ._transport import SubprocessTransport, Transport
 from ._version import Version
 from .modeltypes import ModelInfo
 from .secrettypes import RevealedSecret, Secret, SecretURI
-from .statustypes import Status, StatusInfo
+from .statustypes import ControllerStatus, Status, StatusInfo
 from .unittypes import UnitInfo
 
 logger = logging.getLogger('jubilant')
@@ -48,6 +55,10 @@ ConfigValue = bool | int | float | str | SecretURI
 ConstraintValue = bool | int | float | str
 """The possible types a constraint value can be (model, bootstrap or deployment constraint)."""
 
+# Maximum number of units to pass to a single "juju run" command in run_multiple(), to keep
+# the command line (and the time to the first result) reasonable for very large applications.
+_MAX_UNITS_PER_RUN = 100
+
 
 class Juju:
     """Instantiate this class to run Juju commands.
@@ -71,6 +82,12 @@ class Juju:
             parameter is not specified.
         cli_binary: Path to the Juju CLI binary. If not specified, uses ``juju`` and assumes it is
             in the PATH.
+        status_ttl: If specified, cache the result of :meth:`status` for this many seconds.
+            See :attr:`status_ttl`.
+        transport: If specified, use this to run Juju CLI commands instead of running them
+            directly in a subprocess. See :class:`Transport`.
+        retry: If specified, retry commands that fail with a transient controller error
+            according to this policy. See :class:`RetryPolicy`.
     """
 
     model: str | None
@@ -94,16 +111,45 @@ class Juju:
     cli_binary: str
     """Path to the Juju CLI binary. If None, uses ``juju`` and assumes it is in the PATH."""
 
+    status_ttl: float | None
+    """If not None, cache the result of :meth:`status` for this many seconds.
+
+    This avoids running ``juju status`` again when code such as fixtures and assertions fetch the
+    status several times in quick succession. :meth:`wait` always fetches a fresh status, but
+    updates the cache with each status it fetches. The cache is cleared whenever this instance
+    runs a Juju command that may change the model, such as :meth:`deploy` or :meth:`config`.
+
+    Changes made outside this instance (for example, by a charm or another :class:`Juju`
+    instance) aren't seen until the cached status expires.
+    """
+
+    transport: Transport
+    """Transport used to run Juju CLI commands, such as :class:`RecordingTransport`."""
+
+    retry: RetryPolicy | None
+    """If not None, retry commands that fail with a transient controller error."""
+
     def __init__(
         self,
         *,
         model: str | None = None,
         wait_timeout: float = 3 * 60.0,
         cli_binary: str | pathlib.Path | None = None,
+        status_ttl: float | None = None,
+        transport: Transport | None = None,
+        retry: RetryPolicy | None = None,
     ):
         self.model = model
         self.wait_timeout = wait_timeout
         self.cli_binary = str(cli_binary or 'juju')
+        self.status_ttl = status_ttl
+        self.transport = transport or SubprocessTransport()
+        self.retry = retry
+        self._status_cache: dict[tuple[str | None, ...], tuple[float, Status]] = {}
+        # Incremented when each command that may change the model starts and finishes, so that
+        # a status fetched across either point isn't cached.
+        self._status_generation = 0
+        self._status_lock = threading.Lock()
 
     def __repr__(self) -> str:
         args = [
@@ -111,6 +157,12 @@ class Juju:
             f'wait_timeout={self.wait_timeout}',
             f'cli_binary={self.cli_binary!r}',
         ]
+        if self.status_ttl is not None:
+            args.append(f'status_ttl={self.status_ttl}')
+        if not isinstance(self.transport, SubprocessTransport):
+            args.append(f'transport={self.transport!r}')
+        if self.retry is not None:
+            args.append(f'retry={self.retry!r}')
         return f'Juju({", ".join(args)})'
 
     # Keep the public methods in alphabetical order, so we don't have to think
@@ -545,22 +597,83 @@ class Juju:
         timeout: float | None = None,
     ) -> tuple[str, str]:
         """Run a Juju CLI command and return its standard output and standard error."""
+        read_only = args[0] in _READ_ONLY_COMMANDS
+        if not read_only:
+            self._invalidate_status_cache()
         if include_model and self.model is not None:
             args = (args[0], '--model', self.model, *args[1:])
         if log:
             logger.info('cli: juju %s', shlex.join(args))
+
+        start = time.monotonic()
         try:
-            process = subprocess.run(
-                [self.cli_binary, *args],
-                check=True,
-                capture_output=True,
-                encoding='utf-8',
-                input=stdin,
-                timeout=timeout,
-            )
-        except subprocess.CalledProcessError as e:
-            raise CLIError(e.returncode, e.cmd, e.stdout, e.stderr) from None
-        return (process.stdout, process.stderr)
+            attempt = 1
+            while True:
+                process = self._run_cli(args, stdin, timeout, read_only, attempt)
+                if process.returncode == 0:
+                    return (process.stdout, process.stderr)
+
+                retry = self.retry
+                delay = retry.backoff(attempt, 0) if retry is not None else 0
+                if (
+                    retry is None
+                    or attempt >= retry.max_attempts
+                    or time.monotonic() - start + delay > retry.deadline
+                    or not retry._should_retry(args[0], read_only, process.stderr)
+                ):
+                    raise CLIError(
+                        process.returncode, process.args, process.stdout, process.stderr
+                    )
+
+                logger.warning(
+                    'cli: juju %s failed (attempt %d of %d), retrying in %.1fs: %s',
+                    args[0],
+                    attempt,
+                    retry.max_attempts,
+                    delay,
+                    process.stderr.strip(),
+                )
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            if not read_only:
+                # Another thread may have cached a status while the command was running.
+                self._invalidate_status_cache()
+
+    def _invalidate_status_cache(self) -> None:
+        with self._status_lock:
+            self._status_generation += 1
+            self._status_cache.clear()
+
+    def _cache_status(self, status_args: list[str], generation: int, status: Status) -> None:
+        # Don't cache a status that may predate a change made while it was being fetched.
+        if self.status_ttl is None:
+            return
+        with self._status_lock:
+            if self._status_generation == generation:
+                self._status_cache[(self.model, *status_args)] = (time.monotonic(), status)
+
+    def _run_cli(
+        self,
+        args: tuple[str, ...],
+        stdin: str | None,
+        timeout: float | None,
+        read_only: bool,
+        attempt: int,
+    ) -> subprocess.CompletedProcess[str]:
+        with _limits.acquire(read_only=read_only):
+            start = time.monotonic()
+            try:
+                process = self.transport.run(
+                    [self.cli_binary, *args], stdin=stdin, timeout=timeout
+                )
+            except subprocess.TimeoutExpired:
+                _metrics.record_command(args, start, None, None, None, attempt)
+                raise
+        _metrics.record_command(
+            args, start, process.returncode, process.stdout, process.stderr, attempt
+        )
+        return process
 
     @overload
     def config(self, app: str, *, app_config: bool = False) -> Mapping[str, ConfigValue]: ...
@@ -601,7 +714,7 @@ class Juju:
         """
         if values is None and not reset:
             stdout = self.cli('config', '--format', 'json', app)
-            outer = json.loads(stdout)
+            outer = _json.loads(stdout)
             inner = outer['application-config'] if app_config else outer['settings']
             result = {
                 k: SecretURI(v['value']) if v['type'] == 'secret' else v['value']
@@ -655,9 +768,27 @@ class Juju:
 
         self.cli(*args)
 
-    def debug_log(self, *, limit: int = 0) -> str:
+    def debug_log(
+        self,
+        *,
+        limit: int = 0,
+        include: str | Iterable[str] | None = None,
+        exclude: str | Iterable[str] | None = None,
+        level: str | None = None,
+        include_module: str | Iterable[str] | None = None,
+        exclude_module: str | Iterable[str] | None = None,
+        replay: bool = False,
+    ) -> str:
         """Return debug log messages from a model.
 
+        The filters are applied by the controller, so only the matching messages are sent.
+        For example, to fetch just the errors from MySQL units, parsed into
+        :class:`LogEntry` objects::
+
+            log = juju.debug_log(include='mysql', level='ERROR')
+            for entry in jubilant.parse_debug_log(log):
+                print(entry.entity, entry.message)
+
         For example, to create a pytest fixture which shows the last 1000 log lines if any tests
         fail::
 
@@ -672,10 +803,86 @@ class Juju:
         Args:
             limit: Limit the result to the most recent *limit* lines. Defaults to 0, meaning
                 return all lines in the log.
+            include: Only show messages from these entities, for example ``mysql/0``,
+                ``mysql`` (all units of an app), or ``0`` (a machine). Wildcards such as
+                ``mysql/*`` are supported.
+            exclude: Don't show messages from these entities.
+            level: Only show messages at this level or above, for example ``WARNING``.
+            include_module: Only show messages from these modules, for example
+                ``juju.worker.uniter`` (includes submodules).
+            exclude_module: Don't show messages from these modules.
+            replay: If true, show the earliest *limit* lines instead of the most recent.
         """
         args = ['debug-log', '--limit', str(limit)]
+        args.extend(
+            _debug_log_filter_args(include, exclude, level, include_module, exclude_module)
+        )
+        if replay:
+            args.append('--replay')
         return self.cli(*args)
 
+    def debug_log_stream(
+        self,
+        *,
+        lines: int = 10,
+        replay: bool = False,
+        keep: int = 1000,
+        include: str | Iterable[str] | None = None,
+        exclude: str | Iterable[str] | None = None,
+        level: str | None = None,
+        include_module: str | Iterable[str] | None = None,
+        exclude_module: str | Iterable[str] | None = None,
+    ) -> DebugLogStream:
+        """Start tailing debug log messages from a model, yielding them as they arrive.
+
+        This runs ``juju debug-log --tail`` as a long-lived process, so unlike :meth:`debug_log`,
+        the log isn't buffered in memory all at once. For example, to show the last 1000 log
+        lines written while a module's tests ran, if any tests fail::
+
+            @pytest.fixture(scope='module')
+            def juju(request: pytest.FixtureRequest):
+                with jubilant.temp_model() as juju, juju.debug_log_stream(lines=0) as log:
+                    yield juju  # run the test
+                    if request.session.testsfailed:
+                        for line in log.recent():
+                            print(line)
+
+        Or iterate over the stream to process each line as it arrives::
+
+            with juju.debug_log_stream() as log:
+                for line in log:
+                    if 'ERROR' in line:
+                        ...
+
+        The process runs the Juju CLI directly, so it isn't affected by :attr:`transport` or
+        :func:`limit_concurrency`.
+
+        Args:
+            lines: Start with this many of the most recent existing lines.
+            replay: If true, start from the beginning of the log instead (*lines* is ignored).
+            keep: Maximum number of lines to retain for :meth:`DebugLogStream.recent`, and the
+                maximum number of unread lines buffered while iterating.
+            include: Only show messages from these entities, for example ``mysql/0``,
+                ``mysql`` (all units of an app), or ``0`` (a machine). Wildcards such as
+                ``mysql/*`` are supported.
+            exclude: Don't show messages from these entities.
+            level: Only show messages at this level or above, for example ``WARNING``.
+            include_module: Only show messages from these modules, for example
+                ``juju.worker.uniter`` (includes submodules).
+            exclude_module: Don't show messages from these modules.
+        """
+        args = ['debug-log', '--tail']
+        if replay:
+            args.append('--replay')
+        else:
+            args.extend(['--lines', str(lines)])
+        args.extend(
+            _debug_log_filter_args(include, exclude, level, include_module, exclude_module)
+        )
+        if self.model is not None:
+            args = [args[0], '--model', self.model, *args[1:]]
+        return DebugLogStream([self.cli_binary, *args], keep)
+
     def deploy(
         self,
         charm: str | pathlib.Path,
@@ -727,7 +934,10 @@ class Juju:
         if isinstance(overlays, str):
             raise TypeError('overlays must be an iterable of str or pathlib.Path, not str')
 
-        with self._deploy_tempdir(charm, resources) as (_charm, resources):
+        with (
+            _metrics.span('deploy', 'deploy', charm=str(charm), app=app),
+            self._deploy_tempdir(charm, resources) as (_charm, resources),
+        ):
             assert _charm is not None
             args = ['deploy', _charm]
 
@@ -777,6 +987,91 @@ class Juju:
 
             self.cli(*args)
 
+    def deploy_many(
+        self,
+        apps: Mapping[str, Mapping[str, Any]],
+        relations: Iterable[tuple[str, str]] = (),
+        *,
+        force: bool = False,
+        trust: bool = False,
+    ) -> None:
+        """Deploy several applications and integrate them, using a single generated bundle.
+
+        This is much faster than calling :meth:`deploy` for each application and
+        :meth:`integrate` for each relation, as Juju deploys the whole bundle in one operation.
+        For example::
+
+            juju.deploy_many(
+                {
+                    'mysql-k8s': {'channel': '8.0/stable', 'trust': True},
+                    'wordpress': {'charm': './wordpress.charm', 'num_units': 2},
+                },
+                relations=[('wordpress:db', 'mysql-k8s:database')],
+            )
+
+        Args:
+            apps: Mapping of application name to its entry in the bundle's ``applications``
+                section, with keys such as ``charm``, ``channel``, ``num_units``, ``options``
+                (config), ``constraints``, ``resources``, and ``trust``. If ``charm`` is not
+                specified, the application name is used. Local charm and resource paths
+                (``pathlib.Path`` objects, or strings starting with ``/`` or ``.``) are
+                supported, as for :meth:`deploy`.
+            relations: Pairs of endpoints to integrate, in the form ``app`` or ``app:endpoint``.
+            force: If true, bypass checks such as supported bases.
+            trust: If true, allow all the applications to run hooks that require access to
+                cloud credentials.
+        """
+        with contextlib.ExitStack() as stack:
+            applications: dict[str, dict[str, Any]] = {}
+            for app, spec in apps.items():
+                spec = dict(spec)
+                # Only local resource paths need staging; others, such as revision numbers,
+                # are passed through unchanged.
+                resources: dict[str, Any] | None = None
+                local_resources: dict[str, str] | None = None
+                if spec.get('resources') is not None:
+                    resources = {
+                        k: _path_str(v) if isinstance(v, pathlib.Path) else v
+                        for k, v in spec['resources'].items()
+                    }
+                    local_resources = {
+                        k: v
+                        for k, v in resources.items()
+                        if isinstance(v, str) and v.startswith(('.', '/'))
+                    }
+                charm, staged = stack.enter_context(
+                    self._deploy_tempdir(spec.get('charm', app), local_resources)
+                )
+                assert charm is not None
+                # Make local paths absolute, as Juju resolves relative paths in a bundle
+                # relative to the bundle file.
+                spec['charm'] = _bundle_path(charm)
+                if resources is not None:
+                    assert staged is not None
+                    staged = {k: _bundle_path(v) for k, v in staged.items()}
+                    spec['resources'] = {**resources, **staged}
+                if spec.get('options') is not None:
+                    # YAML can't represent str subclasses such as SecretURI.
+                    spec['options'] = {
+                        k: str(v) if isinstance(v, str) else v for k, v in spec['options'].items()
+                    }
+                applications[app] = spec
+
+            bundle: dict[str, Any] = {'applications': applications}
+            relation_list = [list(r) for r in relations]
+            if relation_list:
+                bundle['relations'] = relation_list
+
+            with tempfile.NamedTemporaryFile('w+', suffix='.yaml', dir=self._temp_dir) as file:
+                _yaml.safe_dump(bundle, file)
+                file.flush()
+                args = ['deploy', file.name]
+                if force:
+                    args.append('--force')
+                if trust:
+                    args.append('--trust')
+                self.cli(*args)
+
     def destroy_model(
         self,
         model: str,
@@ -840,9 +1135,7 @@ class Juju:
 
         You must specify either *machine* or *unit*, but not both.
 
-        Note: this method does not support running a command on multiple units
-        at once. If you need that, let us know, and we'll consider adding it
-        with a new ``exec_multiple`` method or similar.
+        To run a command on multiple machines or units at once, use :meth:`exec_multiple`.
 
         Args:
             command: Command to run. Because the command is executed using the shell,
@@ -866,12 +1159,93 @@ class Juju:
         if (machine is not None and unit is not None) or (machine is None and unit is None):
             raise TypeError('must specify "machine" or "unit", but not both')
 
-        cli_args = ['exec', '--format', 'json']
         if machine is not None:
-            cli_args.extend(['--machine', str(machine)])
+            target_args = ['--machine', str(machine)]
         else:
             assert unit is not None
-            cli_args.extend(['--unit', unit])
+            target_args = ['--unit', unit]
+        results = self._exec(command, args, target_args, wait)
+
+        # Don't look up results[unit] directly, because if the caller specifies
+        # app/leader it is returned as app/N, for example app/0.
+        task = next(iter(results.values()))
+        task.raise_on_failure()
+        return task
+
+    def exec_multiple(
+        self,
+        command: str,
+        *args: str,
+        app: str | Iterable[str] | None = None,
+        machine: int | str | Iterable[int | str] | None = None,
+        unit: str | Iterable[str] | None = None,
+        wait: float | None = None,
+    ) -> dict[str, Task]:
+        """Run the command on multiple remote targets at once.
+
+        This runs a single ``juju exec`` command, which runs the command on each
+        target in parallel. You must specify at least one of *app*, *machine*, or *unit*;
+        the command is run on every target matched by any of them.
+
+        Unlike :meth:`exec`, this method doesn't raise :class:`TaskError` if the command
+        fails on some targets. Check :attr:`Task.success` for each result, or call
+        :meth:`Task.raise_on_failure`.
+
+        Example::
+
+            tasks = juju.exec_multiple('uptime', app='mysql')
+            for unit, task in tasks.items():
+                print(unit, task.stdout)
+
+        Args:
+            command: Command to run. Because the command is executed using the shell,
+                arguments may also be included here as a single string, for example
+                ``juju.exec_multiple('echo foo', ...)``.
+            args: Arguments of the command.
+            app: Name or names of applications to run the command on. The command is run on
+                all units of each application.
+            machine: ID or IDs of machines to run the command on, for example ``0`` or
+                ``["0", "0/lxd/0"]``.
+            unit: Name or names of units to run the command on, for example ``mysql/0`` or
+                ``["mysql/0", "mysql/1"]``.
+            wait: Maximum time to wait for the command to finish on all targets;
+                :class:`TimeoutError` is raised if this is reached. Juju's default is to wait
+                5 minutes.
+
+        Returns:
+            Mapping of target (unit name or machine ID) to the task created to run the command
+            on that target.
+
+        Raises:
+            ValueError: if none of the targets exist.
+            TimeoutError: if *wait* was specified and the wait time was reached.
+        """
+        if app is None and machine is None and unit is None:
+            raise TypeError('must specify at least one of "app", "machine", or "unit"')
+
+        target_args: list[str] = []
+        if app is not None:
+            if not isinstance(app, str):
+                app = ','.join(app)
+            target_args.extend(['--application', app])
+        if machine is not None:
+            if not isinstance(machine, (int, str)):
+                machine = ','.join(str(m) for m in machine)
+            target_args.extend(['--machine', str(machine)])
+        if unit is not None:
+            if not isinstance(unit, str):
+                unit = ','.join(unit)
+            target_args.extend(['--unit', unit])
+        return self._exec(command, args, target_args, wait)
+
+    def _exec(
+        self,
+        command: str,
+        args: Iterable[str],
+        target_args: Iterable[str],
+        wait: float | None,
+    ) -> dict[str, Task]:
+        cli_args = ['exec', '--format', 'json', *target_args]
         if wait is not None:
             cli_args.extend(['--wait', f'{wait}s'])
         cli_args.append('--')
@@ -885,21 +1259,16 @@ class Juju:
                 msg = f'timed out waiting for command, stderr:\n{exc.stderr}'
                 raise TimeoutError(msg) from None
             # The "juju exec" CLI command itself fails if the exec'd command fails.
-            if 'task failed' not in exc.stderr:
+            if not _TASK_FAILED_RE.search(exc.stderr):
                 raise
             stdout = exc.stdout
             stderr = exc.stderr
 
         # Command doesn't return any stdout if no units exist.
-        results: dict[str, Any] = json.loads(stdout) if stdout.strip() else {}
+        results: dict[str, Any] = _json.loads(stdout) if stdout.strip() else {}
         if not results:
             raise ValueError(f'error running command, stderr:\n{stderr}')
-        # Don't look up results[unit] directly, because if the caller specifies
-        # app/leader it is returned as app/N, for example app/0.
-        task_dict = next(iter(results.values()))
-        task = Task._from_dict(task_dict)
-        task.raise_on_failure()
-        return task
+        return {target: Task._from_dict(task_dict) for target, task_dict in results.items()}
 
     def grant_secret(self, identifier: str | SecretURI, app: str | Iterable[str]) -> None:
         """Grant access to a secret for one or more applications.
@@ -969,7 +1338,7 @@ class Juju:
         """
         if values is None and not reset:
             stdout = self.cli('model-config', '--format', 'json')
-            result = json.loads(stdout)
+            result = _json.loads(stdout)
             return {k: v['Value'] for k, v in result.items() if 'Value' in v}
 
         args = ['model-config']
@@ -1002,7 +1371,7 @@ class Juju:
         """
         if constraints is None:
             stdout = self.cli('model-constraints', '--format', 'json')
-            return json.loads(stdout)
+            return _json.loads(stdout)
 
         args = ['set-model-constraints']
         args.extend(_format_config(k, v) for k, v in constraints.items())
@@ -1241,9 +1610,7 @@ class Juju:
     ) -> Task:
         """Run an action on the given unit and wait for the result.
 
-        Note: this method does not support running an action on multiple units
-        at once. If you need that, let us know, and we'll consider adding it
-        with a new ``run_multiple`` method or similar.
+        To run an action on multiple units at once, use :meth:`run_multiple`.
 
         Example::
 
@@ -1267,10 +1634,68 @@ class Juju:
             TaskError: if the action failed.
             TimeoutError: if *wait* was specified and the wait time was reached.
         """
-        args = ['run', '--format', 'json', unit, action]
-        if wait is not None:
-            args.extend(['--wait', f'{wait}s'])
+        results = self._run_action([unit], action, params, wait)
+        # Don't look up results[unit] directly, because if the caller specifies
+        # app/leader it is returned as app/N, for example app/0.
+        task = next(iter(results.values()))
+        task.raise_on_failure()
+        return task
 
+    def run_multiple(
+        self,
+        units: Iterable[str],
+        action: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        wait: float | None = None,
+    ) -> dict[str, Task]:
+        """Run an action on multiple units and wait for all the results.
+
+        Juju runs the action on each unit in parallel. The units are passed to a single
+        ``juju run`` command (or a few commands for a very long list of units), and the
+        *params* are written to a single temporary file shared by all of them.
+
+        Unlike :meth:`run`, this method doesn't raise :class:`TaskError` if the action
+        fails on some units. Check :attr:`Task.success` for each result, or call
+        :meth:`Task.raise_on_failure`.
+
+        Example::
+
+            units = juju.status().get_units('mysql')
+            tasks = juju.run_multiple(units, 'rotate-logs')
+            assert all(task.success for task in tasks.values())
+
+        Args:
+            units: Names of units to run the action on, for example
+                ``['mysql/0', 'mysql/1']``.
+            action: Name of action to run.
+            params: Named parameters to pass to the action.
+            wait: Maximum time to wait for the action to finish on each batch of units;
+                :class:`TimeoutError` is raised if this is reached. Juju's default is to wait
+                60 seconds.
+
+        Returns:
+            Mapping of unit name to the task created to run the action on that unit.
+
+        Raises:
+            ValueError: if the action or any of the units doesn't exist.
+            TimeoutError: if *wait* was specified and the wait time was reached.
+        """
+        # Need this check because str is also an iterable of str.
+        if isinstance(units, str):
+            raise TypeError('units must be an iterable of str, not str')
+        units = list(units)
+        if not units:
+            raise TypeError('must specify at least one unit')
+        return self._run_action(units, action, params, wait)
+
+    def _run_action(
+        self,
+        units: list[str],
+        action: str,
+        params: Mapping[str, Any] | None,
+        wait: float | None,
+    ) -> dict[str, Task]:
         with (
             tempfile.NamedTemporaryFile('w+', dir=self._temp_dir)
             if params is not None
@@ -1280,35 +1705,40 @@ class Juju:
             if params_file is not None:
                 _yaml.safe_dump(params, params_file)
                 params_file.flush()
-                args.extend(['--params', params_file.name])
-            try:
-                stdout, stderr = self._cli(*args)
-            except CLIError as exc:
-                if 'timed out' in exc.stderr:
-                    msg = f'timed out waiting for action, stderr:\n{exc.stderr}'
-                    raise TimeoutError(msg) from None
-                # With Juju 4, trying to run an action that is not defined gives an error like:
-                # ERROR action "not-defined-action" not defined for unit "unit/0". (not found)
-                if '(not found)' in exc.stderr:
-                    raise ValueError(
-                        f'error running action {action!r}, stderr:\n{exc.stderr}'
-                    ) from None
-                # The "juju run" CLI command fails if the action has an uncaught exception.
-                if 'task failed' not in exc.stderr:
-                    raise
-                stdout = exc.stdout
-                stderr = exc.stderr
-
-            # Command doesn't return any stdout if no units exist.
-            results: dict[str, Any] = json.loads(stdout) if stdout.strip() else {}
-            if not results:
-                raise ValueError(f'error running action {action!r}, stderr:\n{stderr}')
-            # Don't look up results[unit] directly, because if the caller specifies
-            # app/leader it is returned as app/N, for example app/0.
-            task_dict = next(iter(results.values()))
-            task = Task._from_dict(task_dict)
-            task.raise_on_failure()
-            return task
+
+            tasks: dict[str, Task] = {}
+            for i in range(0, len(units), _MAX_UNITS_PER_RUN):
+                args = ['run', '--format', 'json', *units[i : i + _MAX_UNITS_PER_RUN], action]
+                if wait is not None:
+                    args.extend(['--wait', f'{wait}s'])
+                if params_file is not None:
+                    args.extend(['--params', params_file.name])
+                try:
+                    stdout, stderr = self._cli(*args)
+                except CLIError as exc:
+                    if 'timed out' in exc.stderr:
+                        msg = f'timed out waiting for action, stderr:\n{exc.stderr}'
+                        raise TimeoutError(msg) from None
+                    # With Juju 4, trying to run an action that is not defined gives an error
+                    # like: ERROR action "not-defined-action" not defined for unit "unit/0".
+                    # (not found)
+                    if '(not found)' in exc.stderr:
+                        raise ValueError(
+                            f'error running action {action!r}, stderr:\n{exc.stderr}'
+                        ) from None
+                    # The "juju run" CLI command fails if the action has an uncaught exception.
+                    if not _TASK_FAILED_RE.search(exc.stderr):
+                        raise
+                    stdout = exc.stdout
+                    stderr = exc.stderr
+
+                # Command doesn't return any stdout if no units exist.
+                results: dict[str, Any] = _json.loads(stdout) if stdout.strip() else {}
+                if not results:
+                    raise ValueError(f'error running action {action!r}, stderr:\n{stderr}')
+                for unit, task_dict in results.items():
+                    tasks[unit] = Task._from_dict(task_dict)
+            return tasks
 
     def scp(
         self,
@@ -1386,7 +1816,7 @@ class Juju:
         if owner is not None:
             args.extend(['--owner', owner])
         stdout = self.cli(*args, '--format', 'json')
-        output = json.loads(stdout)
+        output = _json.loads(stdout)
         return [
             Secret._from_dict({'uri': uri_from_juju, **obj})
             for uri_from_juju, obj in output.items()
@@ -1407,7 +1837,7 @@ class Juju:
             # Use this instance's model if set.
             args.append(self.model)
         stdout = self.cli(*args, include_model=False)
-        results = json.loads(stdout)
+        results = _json.loads(stdout)
         info_dict = next(iter(results.values()))
         return ModelInfo._from_dict(info_dict)
 
@@ -1467,7 +1897,7 @@ class Juju:
         if revision is not None:
             args.extend(['--revision', str(revision)])
         stdout = self.cli(*args)
-        output = json.loads(stdout)
+        output = _json.loads(stdout)
         uri_from_juju, obj = next(iter(output.items()))
         secret = {'uri': uri_from_juju, **obj}
         if reveal:
@@ -1481,7 +1911,7 @@ class Juju:
             unit: Unit name, for example ``mysql/0``.
         """
         stdout = self.cli('show-unit', unit, '--format', 'json')
-        results = json.loads(stdout)
+        results = _json.loads(stdout)
         info_dict = next(iter(results.values()))
         return UnitInfo._from_dict(info_dict)
 
@@ -1528,11 +1958,27 @@ class Juju:
 
         return self.cli(*cli_args)
 
-    def status(self) -> Status:
-        """Fetch the status of the current model, including its applications and units."""
-        stdout = self.cli('status', '--format', 'json')
-        result = json.loads(stdout)
-        return Status._from_dict(result)
+    def status(self, *, apps: str | Iterable[str] | None = None) -> Status:
+        """Fetch the status of the current model, including its applications and units.
+
+        Args:
+            apps: If specified, only fetch the status of these applications (and their units
+                and machines). On large models, this is much faster than fetching the status of
+                the whole model.
+        """
+        status_args = _status_args(apps)
+        if self.status_ttl is not None:
+            cached = self._status_cache.get((self.model, *status_args))
+            if cached is not None and time.monotonic() - cached[0] < self.status_ttl:
+                return cached[1]
+
+        generation = self._status_generation
+        stdout = self.cli(*status_args)
+        with _metrics.timed_parse('status'):
+            result = _json.loads(stdout)
+            status = Status._from_dict(result)
+        self._cache_status(status_args, generation, status)
+        return status
 
     def trust(
         self, app: str, *, remove: bool = False, scope: Literal['cluster'] | None = None
@@ -1649,7 +2095,7 @@ class Juju:
     def version(self) -> Version:
         """Return the parsed Juju CLI version."""
         stdout = self.cli('version', '--format', 'json', '--all', include_model=False)
-        version_dict = json.loads(stdout)
+        version_dict = _json.loads(stdout)
         return Version._from_dict(version_dict)
 
     def wait(
@@ -1657,15 +2103,16 @@ class Juju:
         ready: Callable[[Status], bool],
         *,
         error: Callable[[Status], bool] | None = None,
-        delay: float = 1.0,
+        delay: float | DelaySchedule = 1.0,
         timeout: float | None = None,
         successes: int = 3,
+        watch: bool = False,
+        apps: str | Iterable[str] | None = None,
     ) -> Status:
         """Wait until ``ready(status)`` returns ``True``.
 
-        This fetches the Juju status repeatedly (waiting *delay* seconds between each call),
-        and returns the last status after the *ready* callable returns ``True`` for *successes*
-        times in a row.
+        This fetches the Juju status repeatedly (every *delay* seconds), and returns the last
+        status after the *ready* callable returns ``True`` for *successes* times in a row.
 
         Example::
 
@@ -1695,11 +2142,23 @@ class Juju:
                 before ``wait`` returns.
             error: Callable that takes a :class:`Status` object and returns ``True`` when ``wait``
                 should raise an error (:class:`WaitError`).
-            delay: Delay in seconds between status calls.
+            delay: Delay in seconds from the start of one status call to the start of the next.
+                Instead of a fixed delay, this may be a schedule such as
+                :func:`exponential_backoff` or :func:`adaptive_delay`, which is called after
+                each status call to determine the next delay.
             timeout: Overall timeout in seconds; :class:`TimeoutError` is raised if this
                 is reached. If not specified, uses the *wait_timeout* specified when the
                 instance was created.
             successes: Number of times *ready* must return ``True`` for the wait to succeed.
+            watch: If true, run a single long-lived ``juju status --watch`` process that emits
+                a new status every *delay* seconds, instead of running ``juju status`` for every
+                poll. This avoids starting a new Juju process (and logging in to the controller)
+                each time. If the Juju CLI doesn't support ``--watch``, fall back to polling.
+                If *delay* is a schedule, the first delay it returns is used throughout.
+                The process doesn't count towards :func:`limit_concurrency`.
+            apps: If specified, only fetch the status of these applications (and their units
+                and machines), so the *ready* and *error* callables only see these apps. On
+                large models, this makes each status call much cheaper.
 
         Raises:
             TimeoutError: If the *timeout* is reached. A string representation
@@ -1710,57 +2169,112 @@ class Juju:
         if timeout is None:
             timeout = self.wait_timeout
 
+        schedule = delay if callable(delay) else _poll.fixed_delay(delay)
+        status_args = _status_args(apps)
+
         status = None
+        prev_status_key = None
         success_count = 0
+        polls = 0
+        unchanged = 0
         start = time.monotonic()
 
-        while time.monotonic() - start < timeout:
-            prev_status = status
-
-            stdout, _ = self._cli('status', '--format', 'json', log=False)
-            result = json.loads(stdout)
-            status = Status._from_dict(result)
-
-            if status != prev_status:
-                # Emit app status diff lines. For each app, also emit unit status diff lines.
-                # Sort according to app/unit names to keep the output consistent.
-                prev_apps = prev_status.apps if prev_status else {}
-                for app_name, new_app in sorted(status.apps.items()):
-                    prev_app = prev_apps.get(app_name)
-                    prev_app_status = prev_app.app_status if prev_app else None
-                    items = [(app_name, prev_app_status, new_app.app_status)]
-
-                    prev_units = prev_app.units if prev_app else {}
-                    for unit_name, new_unit in sorted(new_app.units.items()):
-                        prev_unit = prev_units.get(unit_name)
-                        prev_unit_status = prev_unit.workload_status if prev_unit else None
-                        items.append((unit_name, prev_unit_status, new_unit.workload_status))
-
-                    for name, prev, new in items:
-                        _log_short_status_if_needed(name, prev, new)
-
-                # The verbose gron diff lines are always logged at DEBUG level.
-                diff = _status_diff(prev_status, status)
-                if diff:
-                    logger_wait.debug('wait: status changed:\n%s', diff)
-
-            if error is not None and error(status):
-                name = getattr(error, '__qualname__', repr(error))
-                raise WaitError(f'error function {name} returned true\n{status}')
-
-            if ready(status):
-                success_count += 1
-                if success_count >= successes:
-                    return status
-            else:
-                success_count = 0
+        watch_ctx = (
+            contextlib.closing(self._watch_status(status_args, schedule(1, 0)))
+            if watch
+            else contextlib.nullcontext()
+        )
+        with _metrics.span('wait', 'wait'), _metrics.in_wait(), watch_ctx as status_watch:
+            while time.monotonic() - start < timeout:
+                prev_status = status
+                poll_start = time.monotonic()
+                generation = self._status_generation
+
+                stdout = None
+                if status_watch is not None:
+                    stdout = status_watch.get(timeout - (time.monotonic() - start))
+                    if stdout is None:
+                        if status_watch.running:
+                            break  # timed out waiting for the next status
+                        logger_wait.debug(
+                            'wait: juju status --watch exited, falling back to polling:\n%s',
+                            status_watch.output,
+                        )
+                        status_watch = None
+                if stdout is None:
+                    stdout, _ = self._cli(*status_args, log=False)
+
+                # Fast path: if the output is identical apart from the controller timestamp,
+                # reuse the previous status rather than parsing and comparing it all again.
+                status_key, timestamp = _split_status_timestamp(stdout)
+                if prev_status is not None and status_key == prev_status_key:
+                    status = prev_status
+                    if timestamp is not None:
+                        controller = ControllerStatus(timestamp=timestamp)
+                        status = dataclasses.replace(status, controller=controller)
+                    changed = False
+                else:
+                    with _metrics.timed_parse('status'):
+                        result = _json.loads(stdout)
+                        status = Status._from_dict(result)
+                    changed = status != prev_status
+                prev_status_key = status_key
+                _metrics.record_span('poll', 'wait', poll_start, changed=changed)
+                self._cache_status(status_args, generation, status)
+                polls += 1
+                unchanged = 0 if changed else unchanged + 1
+
+                if changed:
+                    # Emit app status diff lines. For each app, also emit unit status diff lines.
+                    # Sort according to app/unit names to keep the output consistent.
+                    prev_apps = prev_status.apps if prev_status else {}
+                    for app_name, new_app in sorted(status.apps.items()):
+                        prev_app = prev_apps.get(app_name)
+                        prev_app_status = prev_app.app_status if prev_app else None
+                        items = [(app_name, prev_app_status, new_app.app_status)]
+
+                        prev_units = prev_app.units if prev_app else {}
+                        for unit_name, new_unit in sorted(new_app.units.items()):
+                            prev_unit = prev_units.get(unit_name)
+                            prev_unit_status = prev_unit.workload_status if prev_unit else None
+                            items.append((unit_name, prev_unit_status, new_unit.workload_status))
+
+                        for name, prev, new in items:
+                            _log_short_status_if_needed(name, prev, new)
+
+                    # The verbose gron diff lines are always logged at DEBUG level, so only
+                    # compute the diff if that will be logged.
+                    if logger_wait.isEnabledFor(logging.DEBUG):
+                        diff = _status_diff(prev_status, status)
+                        if diff:
+                            logger_wait.debug('wait: status changed:\n%s', diff)
+
+                if error is not None and error(status):
+                    name = getattr(error, '__qualname__', repr(error))
+                    raise WaitError(f'error function {name} returned true\n{status}')
+
+                if ready(status):
+                    success_count += 1
+                    if success_count >= successes:
+                        return status
+                else:
+                    success_count = 0
 
-            time.sleep(delay)
+                if status_watch is None:
+                    # Subtract the time taken by the status call, so delay is a real period.
+                    elapsed = time.monotonic() - poll_start
+                    time.sleep(max(schedule(polls, unchanged) - elapsed, 0))
 
         if status is None:
             raise TimeoutError(f'wait timed out after {timeout}s')
         raise TimeoutError(f'wait timed out after {timeout}s\n{status}')
 
+    def _watch_status(self, status_args: list[str], delay: float) -> _StatusWatch:
+        args = [*status_args, '--watch', f'{delay}s']
+        if self.model is not None:
+            args = [args[0], '--model', self.model, *args[1:]]
+        return _StatusWatch([self.cli_binary, *args])
+
     @functools.cached_property
     def _juju_is_snap(self) -> bool:
         which = shutil.which(self.cli_binary)
@@ -1776,6 +2290,11 @@ class Juju:
         else:
             return tempfile.gettempdir()
 
+    @property
+    def _staging_dir(self) -> str:
+        # Cache of files staged for a snap Juju, shared by all Juju instances and processes.
+        return os.path.join(self._temp_dir, '.jubilant-staging')
+
     @contextlib.contextmanager
     def _path_for_juju(self, path: str | pathlib.Path) -> Generator[str]:
         """Yield a path Juju can access, copying into a snap-safe temp dir if needed."""
@@ -1789,9 +2308,10 @@ class Juju:
             shutil.copy(path, temp)
             yield temp
 
-    # This context manager is for deploy() and refresh(), and automatically copies
+    # This context manager is for deploy() and refresh(), and automatically stages
     # a local charm file and local resource files into a temporary directory if Juju
-    # is running as a snap (in which case /tmp is not accessible).
+    # is running as a snap (in which case /tmp is not accessible). Files are hard-linked
+    # from a content-addressed cache, so deploying the same charm again doesn't copy it.
     @contextlib.contextmanager
     def _deploy_tempdir(
         self,
@@ -1799,10 +2319,7 @@ class Juju:
         resources: Mapping[str, str] | None,
     ) -> Generator[tuple[str | None, Mapping[str, str] | None]]:
         if isinstance(charm, pathlib.Path):
-            # We add "./" to any relative pathlib.Path objects in their string form.
-            # pathlib.Path removes the redundant "./", which we need to prevent Juju
-            # from saying the path is ambiguous.
-            charm = str(charm) if charm.is_absolute() else f'./{charm}'
+            charm = _path_str(charm)
         charm_needs_temp = charm is not None and charm.startswith(('.', '/'))
         resources_needs_temp = resources is not None and any(
             v.startswith(('.', '/')) for v in resources.values()
@@ -1817,7 +2334,7 @@ class Juju:
             if charm_needs_temp:
                 assert charm is not None
                 temp = temp_dir / '_temp.charm'
-                shutil.copy(charm, temp)
+                _staging.stage(charm, str(temp), self._staging_dir)
                 charm = str(temp)
 
             if resources_needs_temp:
@@ -1827,11 +2344,108 @@ class Juju:
                     if v.startswith(('.', '/')):
                         ext = pathlib.PurePath(v).suffix
                         resources[k] = str(temp_dir / (k + ext))
-                        shutil.copy(v, resources[k])
+                        _staging.stage(v, resources[k], self._staging_dir)
 
             yield charm, resources
 
 
+class _StatusWatch:
+    """Long-lived ``juju status --watch`` process that emits a JSON status document per line.
+
+    A background thread reads the process's output and queues each status document, so that
+    :meth:`get` can wait for the next one with a timeout.
+    """
+
+    def __init__(self, args: list[str]):
+        self.output = ''
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding='utf-8',
+        )
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        """Whether the process is still producing status documents."""
+        return self._process.poll() is None
+
+    def get(self, timeout: float) -> str | None:
+        """Return the next status document, or None if *timeout* is reached or the process exits.
+
+        Use :attr:`running` to tell the two cases apart.
+        """
+        try:
+            return self._queue.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Stop the process and wait for it to exit."""
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        if self._process.stdout is not None:
+            self._process.stdout.close()
+
+    def _read(self) -> None:
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            # Skip anything Juju prints before the document, such as terminal control codes.
+            brace = line.find('{')
+            if brace == -1:
+                self.output += line
+                continue
+            self._queue.put(line[brace:])
+        self._process.wait()
+        self._queue.put(None)
+
+
+def _debug_log_filter_args(
+    include: str | Iterable[str] | None,
+    exclude: str | Iterable[str] | None,
+    level: str | None,
+    include_module: str | Iterable[str] | None,
+    exclude_module: str | Iterable[str] | None,
+) -> list[str]:
+    args: list[str] = []
+    for option, values in [
+        ('--include', include),
+        ('--exclude', exclude),
+        ('--include-module', include_module),
+        ('--exclude-module', exclude_module),
+    ]:
+        if values is None:
+            continue
+        if isinstance(values, str):
+            values = [values]
+        for value in values:
+            args.extend([option, value])
+    if level is not None:
+        args.extend(['--level', level])
+    return args
+
+
+def _path_str(path: pathlib.Path) -> str:
+    # We add "./" to any relative pathlib.Path objects in their string form.
+    # pathlib.Path removes the redundant "./", which we need to prevent Juju
+    # from saying the path is ambiguous.
+    return str(path) if path.is_absolute() else f'./{path}'
+
+
+def _bundle_path(path: str) -> str:
+    if path.startswith('.'):
+        return os.path.abspath(path)
+    return path
+
+
 def _format_config(k: str, v: ConfigValue) -> str:
     if isinstance(v, bool):
         v = 'true' if v else 'false'
@@ -1869,6 +2483,53 @@ def _same_model(a: str | None, b: str | None) -> bool:
     return True
 
 
+# Juju commands that never change the model, so don't need to clear the status cache. These
+# also use the "read" limit of limit_concurrency().
+_READ_ONLY_COMMANDS = frozenset({
+    'controllers',
+    'debug-log',
+    'models',
+    'secrets',
+    'show-controller',
+    'show-model',
+    'show-secret',
+    'show-unit',
+    'status',
+    'version',
+})
+
+
+def _status_args(apps: str | Iterable[str] | None) -> list[str]:
+    args = ['status', '--format', 'json']
+    if apps is not None:
+        if isinstance(apps, str):
+            args.append(apps)
+        else:
+            args.extend(apps)
+    return args
+
+
+# Matches the error output of "juju exec" and "juju run" when the command or action fails on
+# one target ("task failed") or on several ("the following tasks failed").
+_TASK_FAILED_RE = re.compile(r'\btasks? failed\b')
+
+
+# Matches the controller timestamp in "juju status --format json" output, which changes every
+# call. Juju outputs the "controller" object last, but don't rely on that.
+_STATUS_TIMESTAMP_RE = re.compile(r'"controller"\s*:\s*\{\s*"timestamp"\s*:\s*"([^"]*)"\s*\}')
+
+
+def _split_status_timestamp(stdout: str) -> tuple[str, str | None]:
+    """Split raw status JSON into the output without the controller timestamp, and the timestamp.
+
+    If there's no controller timestamp, return the output unchanged and None.
+    """
+    match = _STATUS_TIMESTAMP_RE.search(stdout)
+    if match is None:
+        return stdout, None
+    return stdout[: match.start(1)] + stdout[match.end(1) :], match.group(1)
+
+
 def _log_short_status_if_needed(name: str, old: StatusInfo | None, new: StatusInfo) -> None:
     level = logging.ERROR if new.current == 'error' else logging.INFO
     if old is None:
@@ -1883,17 +2544,16 @@ def _log_short_status_if_needed(name: str, old: StatusInfo | None, new: StatusIn
 def _status_diff(old: Status | None, new: Status) -> str:
     """Return a line-based diff of two status objects."""
     if old is None:
-        old_lines = []
+        lines = ('+ ' + line for line in _pretty.gron(new))
     else:
-        old_lines = [line for line in _pretty.gron(old) if _status_line_ok(line)]
-    new_lines = [line for line in _pretty.gron(new) if _status_line_ok(line)]
-    return '\n'.join(_pretty.diff(old_lines, new_lines))
+        lines = _pretty.gron_diff(old, new)
+    return '\n'.join(line for line in lines if _status_line_ok(line))
 
 
 def _status_line_ok(line: str) -> bool:
-    """Return whether the status line should be included in the diff."""
+    """Return whether the status diff line should be included in the diff."""
     # Exclude controller timestamp as it changes every update and is just noise.
-    field, _, _ = line.partition(' = ')
+    field, _, _ = line[2:].partition(' = ')
     if field == '.controller.timestamp':
         return False
     # Exclude status-updated-since timestamps as they just add noise (and log lines already
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import os
+import threading
+import time
+from collections.abc import Generator
+
+
+class _Slots:
+    """A fixed number of slots, optionally shared with other processes via lock files."""
+
+    def __init__(self, name: str, limit: int, lock_dir: str | None):
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._paths: list[str] = []
+        if lock_dir is not None:
+            self._paths = [os.path.join(lock_dir, f'{name}-{i}.lock') for i in range(limit)]
+
+    @contextlib.contextmanager
+    def acquire(self) -> Generator[None]:
+        with self._semaphore:
+            if not self._paths:
+                yield
+                return
+            fd = self._lock_file()
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def _lock_file(self) -> int:
+        delay = 0.01
+        while True:
+            for path in self._paths:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(fd)
+                    continue
+                return fd
+            # All slots are held by other processes; poll until one is released.
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+
+_read_slots: _Slots | None = None
+_write_slots: _Slots | None = None
+
+
+def limit_concurrency(
+    read: int | None = None,
+    write: int | None = None,
+    *,
+    lock_dir: str | os.PathLike[str] | None = None,
+) -> None:
+    """Limit the number of Juju CLI commands that run at the same time.
+
+    The limits apply to all :class:`Juju` instances and threads in the process. Read-only
+    commands, such as ``juju status`` and ``juju show-unit``, and commands that may change the
+    model, such as ``juju deploy``, have separate limits. Commands wait for a free slot before
+    starting. For example, to run at most 4 status-like commands and 2 other commands at once::
+
+        jubilant.limit_concurrency(read=4, write=2)
+
+    Call with no arguments to remove the limits.
+
+    The limits only apply to commands that run to completion. The long-lived processes
+    started by :meth:`Juju.debug_log_stream` and ``Juju.wait(watch=True)`` don't take a slot,
+    as holding one for the life of the process could block other commands indefinitely. Each
+    of those processes keeps its own connection to the controller open while it runs.
+
+    Args:
+        read: Maximum number of read-only commands to run at once, or None for no limit.
+        write: Maximum number of other commands to run at once, or None for no limit.
+        lock_dir: If specified, also share the limits with other processes that use the same
+            directory, such as pytest-xdist workers, using a lock file for each slot.
+    """
+    global _read_slots, _write_slots
+
+    if read is not None and read < 1:
+        raise ValueError(f'read limit must be at least 1, not {read}')
+    if write is not None and write < 1:
+        raise ValueError(f'write limit must be at least 1, not {write}')
+    if lock_dir is not None:
+        lock_dir = os.fspath(lock_dir)
+        os.makedirs(lock_dir, exist_ok=True)
+
+    _read_slots = _Slots('read', read, lock_dir) if read is not None else None
+    _write_slots = _Slots('write', write, lock_dir) if write is not None else None
+
+
+def acquire(*, read_only: bool) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager that holds a slot for a command while it runs."""
+    slots = _read_slots if read_only else _write_slots
+    if slots is None:
+        return contextlib.nullcontext()
+    return slots.acquire()
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import shlex
+import threading
+import time
+from collections.abc import Generator
+from typing import Any
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CommandEvent:
+    """Timing and size information for a single Juju CLI command."""
+
+    command: str
+    """Juju command name, for example ``status`` or ``deploy``."""
+
+    args: tuple[str, ...]
+    """Full command-line arguments, excluding the Juju CLI binary."""
+
+    start: float
+    """Start time of the command, from :func:`time.monotonic`."""
+
+    duration: float
+    """Wall time taken by the command, in seconds."""
+
+    returncode: int | None
+    """Exit code of the command, or None if it timed out."""
+
+    stdout_bytes: int = 0
+    """Size of the command's standard output, in bytes."""
+
+    stderr_bytes: int = 0
+    """Size of the command's standard error, in bytes."""
+
+    in_wait: bool = False
+    """Whether the command was run by :meth:`Juju.wait`."""
+
+    thread_id: int = 0
+    """Identifier of the thread that ran the command, from :func:`threading.get_ident`."""
+
+    attempt: int = 1
+    """Attempt number, greater than 1 if the command was retried (see :class:`RetryPolicy`)."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ParseEvent:
+    """Time taken to parse a command's JSON output into dataclasses, such as :class:`Status`."""
+
+    command: str
+    """Juju command name whose output was parsed, for example ``status``."""
+
+    start: float
+    """Start time of the parsing, from :func:`time.monotonic`."""
+
+    duration: float
+    """Time taken to parse the output, in seconds."""
+
+    in_wait: bool = False
+    """Whether the output was parsed by :meth:`Juju.wait`."""
+
+    thread_id: int = 0
+    """Identifier of the thread that parsed the output, from :func:`threading.get_ident`."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SpanEvent:
+    """A higher-level operation, such as a :meth:`Juju.wait` call or a :func:`temp_model`."""
+
+    name: str
+    """Name of the operation, for example ``wait`` or ``poll``."""
+
+    category: str
+    """Category of the operation, for example ``wait``, ``deploy``, or ``model``."""
+
+    start: float
+    """Start time of the operation, from :func:`time.monotonic`."""
+
+    duration: float
+    """Wall time taken by the operation, in seconds."""
+
+    args: dict[str, Any] = dataclasses.field(default_factory=dict)  # type: ignore
+    """Extra information about the operation, such as the model name."""
+
+    thread_id: int = 0
+    """Identifier of the thread that ran the operation, from :func:`threading.get_ident`."""
+
+
+class Metrics:
+    """Collects timing information about Juju CLI commands; see :func:`collect_metrics`."""
+
+    def __init__(self):
+        self.commands: list[CommandEvent] = []
+        """Commands run, in the order they finished."""
+
+        self.parses: list[ParseEvent] = []
+        """Output parsing events, in the order they finished."""
+
+        self.spans: list[SpanEvent] = []
+        """Higher-level operations, such as waits, in the order they finished."""
+
+        self.start: float = time.monotonic()
+        """Time collection started, from :func:`time.monotonic`."""
+
+        self.end: float | None = None
+        """Time collection ended, from :func:`time.monotonic`, or None if still collecting."""
+
+    def summary(self) -> str:
+        """Return a human-readable summary of the time spent per command.
+
+        Example output::
+
+            Juju CLI: 417 calls, 126.3s (82% of 154.0s wall time)
+              status: 412 calls, 58.5s (38%), 405 from wait, 7.9 MB stdout
+              deploy: 3 calls, 60.1s (39%), 0 from wait, 0.0 MB stdout
+              ...
+            Retries: 2 (status: 2)
+            Parsing: status: 412 calls, 1.4s (1%)
+
+        Percentages are relative to the wall time from when collection started until it ended
+        (or now, if still collecting). Commands run concurrently in threads may add up to more
+        than 100%.
+        """
+        end = self.end if self.end is not None else time.monotonic()
+        wall_time = max(end - self.start, 1e-9)
+
+        by_command: dict[str, list[CommandEvent]] = collections.defaultdict(list)
+        for event in self.commands:
+            by_command[event.command].append(event)
+        total = sum(e.duration for e in self.commands)
+
+        lines = [
+            f'Juju CLI: {len(self.commands)} calls, {total:.1f}s '
+            f'({total / wall_time:.0%} of {wall_time:.1f}s wall time)'
+        ]
+        for command, events in sorted(
+            by_command.items(), key=lambda item: -sum(e.duration for e in item[1])
+        ):
+            duration = sum(e.duration for e in events)
+            in_wait = sum(1 for e in events if e.in_wait)
+            stdout_mb = sum(e.stdout_bytes for e in events) / 1e6
+            lines.append(
+                f'  {command}: {len(events)} calls, {duration:.1f}s ({duration / wall_time:.0%}), '
+                f'{in_wait} from wait, {stdout_mb:.1f} MB stdout'
+            )
+
+        retries = collections.Counter(e.command for e in self.commands if e.attempt > 1)
+        if retries:
+            counts = ', '.join(f'{command}: {n}' for command, n in sorted(retries.items()))
+            lines.append(f'Retries: {retries.total()} ({counts})')
+
+        by_parse: dict[str, list[ParseEvent]] = collections.defaultdict(list)
+        for event in self.parses:
+            by_parse[event.command].append(event)
+        for command, events in sorted(by_parse.items()):
+            duration = sum(e.duration for e in events)
+            lines.append(
+                f'Parsing: {command}: {len(events)} calls, {duration:.1f}s '
+                f'({duration / wall_time:.0%})'
+            )
+        return '\n'.join(lines)
+
+    def write_chrome_trace(self, path: str | os.PathLike[str]) -> None:
+        """Write the collected events to a file in Chrome's trace event format.
+
+        Open the file in `Perfetto <https://ui.perfetto.dev/>`_ or ``chrome://tracing`` to see
+        a timeline of the session, with a span for each CLI command, :meth:`Juju.wait` call
+        (and each of its status polls), :meth:`Juju.deploy` call, and :func:`temp_model`
+        lifetime, laid out per thread. For example::
+
+            with jubilant.collect_metrics() as metrics:
+                ...
+            metrics.write_chrome_trace('jubilant-trace.json')
+        """
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+
+        def add(
+            name: str,
+            category: str,
+            start: float,
+            duration: float,
+            thread_id: int,
+            args: dict[str, Any],
+        ):
+            events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - self.start) * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': thread_id,
+                'args': args,
+            })
+
+        for c in self.commands:
+            args = {
+                'command': shlex.join(c.args),
+                'returncode': c.returncode,
+                'stdout_bytes': c.stdout_bytes,
+                'stderr_bytes': c.stderr_bytes,
+                'attempt': c.attempt,
+            }
+            add(f'juju {c.command}', 'cli', c.start, c.duration, c.thread_id, args)
+        for p in self.parses:
+            add(f'parse {p.command}', 'parse', p.start, p.duration, p.thread_id, {})
+        for sp in self.spans:
+            add(sp.name, sp.category, sp.start, sp.duration, sp.thread_id, sp.args)
+        # Sort parents before children that start at the same time, for viewers that need it.
+        events.sort(key=lambda e: (e['ts'], -e['dur']))
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+_collectors: contextvars.ContextVar[tuple[Metrics, ...]] = contextvars.ContextVar(
+    'jubilant_metrics_collectors', default=()
+)
+_in_wait: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    'jubilant_metrics_in_wait', default=False
+)
+
+
+@contextlib.contextmanager
+def collect_metrics() -> Generator[Metrics]:
+    """Collect timing information for Juju CLI commands run within this context.
+
+    This records every command run by any :class:`Juju` instance, including its duration, exit
+    code, output size, and whether it was run by :meth:`Juju.wait`, as well as the time taken
+    to parse ``juju status`` output. For example, to print a summary at the end of a test
+    session, add this to ``conftest.py``::
+
+        @pytest.fixture(scope='session', autouse=True)
+        def juju_metrics():
+            with jubilant.collect_metrics() as metrics:
+                yield metrics
+            print(metrics.summary())
+
+    Collection is scoped using :mod:`contextvars`, so commands run in other threads are only
+    recorded if the thread runs in a copy of this context (see
+    :func:`contextvars.copy_context`). Collectors may be nested.
+    """
+    metrics = Metrics()
+    token = _collectors.set((*_collectors.get(), metrics))
+    try:
+        yield metrics
+    finally:
+        _collectors.reset(token)
+        metrics.end = time.monotonic()
+
+
+def record_command(
+    args: tuple[str, ...],
+    start: float,
+    returncode: int | None,
+    stdout: str | None,
+    stderr: str | None,
+    attempt: int = 1,
+) -> None:
+    """Record a command event in all active collectors."""
+    collectors = _collectors.get()
+    if not collectors:
+        return
+    event = CommandEvent(
+        command=args[0] if args else '',
+        args=args,
+        start=start,
+        duration=time.monotonic() - start,
+        returncode=returncode,
+        stdout_bytes=len(stdout.encode()) if stdout else 0,
+        stderr_bytes=len(stderr.encode()) if stderr else 0,
+        in_wait=_in_wait.get(),
+        thread_id=threading.get_ident(),
+        attempt=attempt,
+    )
+    for metrics in collectors:
+        metrics.commands.append(event)
+
+
+@contextlib.contextmanager
+def timed_parse(command: str) -> Generator[None]:
+    """Record the time taken by the body of the with statement as a parse event."""
+    if not _collectors.get():
+        yield
+        return
+    start = time.monotonic()
+    yield
+    event = ParseEvent(
+        command=command,
+        start=start,
+        duration=time.monotonic() - start,
+        in_wait=_in_wait.get(),
+        thread_id=threading.get_ident(),
+    )
+    for metrics in _collectors.get():
+        metrics.parses.append(event)
+
+
+def record_span(name: str, category: str, start: float, **args: Any) -> None:
+    """Record a span event, from *start* until now, in all active collectors."""
+    collectors = _collectors.get()
+    if not collectors:
+        return
+    event = SpanEvent(
+        name=name,
+        category=category,
+        start=start,
+        duration=time.monotonic() - start,
+        args=args,
+        thread_id=threading.get_ident(),
+    )
+    for metrics in collectors:
+        metrics.spans.append(event)
+
+
+@contextlib.contextmanager
+def span(name: str, category: str, **args: Any) -> Generator[None]:
+    """Record the body of the with statement as a span event."""
+    if not _collectors.get():
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        record_span(name, category, start, **args)
+
+
+@contextlib.contextmanager
+def in_wait() -> Generator[None]:
+    """Mark commands run in the body of the with statement as run by :meth:`Juju.wait`."""
+    token = _in_wait.set(True)
+    try:
+        yield
+    finally:
+        _in_wait.reset(token)
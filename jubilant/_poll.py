@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+DelaySchedule = Callable[[int, int], float]
+"""A callable that returns the delay in seconds before the next status call in :meth:`Juju.wait`.
+
+It's called after each status call with two arguments: the number of status calls made so
+far, and the number of calls in a row for which the status hasn't changed (0 if the latest
+call returned a changed status).
+"""
+
+
+def fixed_delay(delay: float) -> DelaySchedule:
+    """Return a delay schedule that always returns *delay*."""
+
+    def schedule(polls: int, unchanged: int) -> float:
+        return delay
+
+    return schedule
+
+
+def exponential_backoff(
+    initial: float = 1.0,
+    *,
+    factor: float = 2.0,
+    max_delay: float = 10.0,
+    jitter: float = 0.0,
+) -> DelaySchedule:
+    """Return a delay schedule that multiplies the delay by *factor* after each status call.
+
+    Use this for long waits, such as waiting for a slow deployment, to make far fewer status
+    calls than a fixed delay would. For example, to wait up to 30 minutes, starting with a 1s
+    delay and doubling it each time up to a maximum of 30s::
+
+        juju.wait(
+            jubilant.all_active,
+            delay=jubilant.exponential_backoff(1, max_delay=30),
+            timeout=30 * 60,
+        )
+
+    Args:
+        initial: Delay in seconds after the first status call.
+        factor: Multiply the delay by this after each status call.
+        max_delay: Never delay by more than this many seconds.
+        jitter: Randomly adjust each delay by up to this fraction of the delay, for example
+            ``0.1`` for ±10%. This avoids many waits in parallel calling ``juju status``
+            at the same moment.
+    """
+
+    def schedule(polls: int, unchanged: int) -> float:
+        delay = min(initial * factor ** _clamp(polls - 1), max_delay)
+        return _jittered(delay, jitter)
+
+    return schedule
+
+
+def adaptive_delay(
+    fast: float = 1.0,
+    slow: float = 10.0,
+    *,
+    factor: float = 2.0,
+    jitter: float = 0.0,
+) -> DelaySchedule:
+    """Return a delay schedule that polls quickly while the status is changing.
+
+    The delay is *fast* after any status call that returned a changed status. While the status
+    stays the same, the delay is multiplied by *factor* after each call, up to *slow*. This
+    keeps waits responsive while things are happening, and cheap while the model is stable::
+
+        juju.wait(jubilant.all_active, delay=jubilant.adaptive_delay(1, 15))
+
+    Args:
+        fast: Delay in seconds while the status is changing.
+        slow: Maximum delay in seconds while the status is unchanged.
+        factor: Multiply the delay by this after each call that returned an unchanged status.
+        jitter: Randomly adjust each delay by up to this fraction of the delay, for example
+            ``0.1`` for ±10%.
+    """
+
+    def schedule(polls: int, unchanged: int) -> float:
+        delay = min(fast * factor ** _clamp(unchanged), slow)
+        return _jittered(delay, jitter)
+
+    return schedule
+
+
+def _clamp(exponent: int) -> int:
+    # Avoid float overflow on very long waits; the result is capped by max_delay anyway.
+    return min(max(exponent, 0), 100)
+
+
+def _jittered(delay: float, jitter: float) -> float:
+    if not jitter:
+        return delay
+    # Not used for security purposes, just to spread out calls.
+    return delay * random.uniform(1 - jitter, 1 + jitter)  # noqa: S311
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
-import difflib
-from collections.abc import Generator, Sequence
+from collections.abc import Generator
 from typing import cast
 
 _MAX_VALUE = 150
@@ -120,24 +119,102 @@ def gron(value: object, prefix: str = '') -> Generator[str]:
         yield f'{prefix} = {value!r}'
 
 
-def diff(seq1: Sequence[str], seq2: Sequence[str]) -> Generator[str]:
-    """Compare seq1 and seq2; yield lines that have been removed, changed, or added.
+def gron_diff(old: object, new: object, prefix: str = '') -> Generator[str]:
+    """Yield gron-style lines that have been removed from *old* or added in *new*.
 
-    Example::
+    This uses :func:`changes` to walk *old* and *new* in parallel, so it only generates lines
+    for the parts that differ. The cost is roughly linear in the size of the objects, rather
+    than depending on the total number of gron lines.
+
+    Example output (removed lines start with ``-``, added lines with ``+``)::
 
         - .apps['database'].app_status.current = 'active'
         + .apps['database'].app_status.current = 'waiting'
-        - .apps['database'].relations['db'][0].scope = 'global'
         - .apps['database'].relations['db'][1].related_app = 'dummy'
-        - .apps['database'].relations['db'][1].interface = 'xyz'
-        - .apps['database'].relations['db'][1].scope = 'foobar'
-        + .apps['database'].relations['db'][0].scope = 'testy'
     """
-    matcher = difflib.SequenceMatcher(None, seq1, seq2)
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag in {'replace', 'delete'}:
-            for line in seq1[i1:i2]:
+    for gron_path, _, old_v, new_v in changes(old, new, prefix, omit_defaults=True):
+        if old_v is not MISSING:
+            for line in gron(old_v, gron_path):
                 yield '- ' + line
-        if tag in {'replace', 'insert'}:
-            for line in seq2[j1:j2]:
+        if new_v is not MISSING:
+            for line in gron(new_v, gron_path):
                 yield '+ ' + line
+
+
+MISSING = object()
+"""Sentinel that :func:`changes` uses for a value that's not present on one side."""
+
+
+def changes(
+    old: object,
+    new: object,
+    prefix: str = '',
+    path: tuple[str | int, ...] = (),
+    *,
+    omit_defaults: bool = False,
+) -> Generator[tuple[str, tuple[str | int, ...], object, object]]:
+    """Yield ``(gron_path, path, old_value, new_value)`` for each difference in *old* and *new*.
+
+    This walks *old* and *new* in parallel, matching dataclass fields by name, dict items by
+    key, and list items by index. Equal sub-objects are skipped without walking them. A
+    difference is reported at the highest level possible: for example, a dict item that's only
+    in *new* is reported once, with the whole item as *new_value* and :data:`MISSING` as
+    *old_value*.
+
+    *gron_path* is the path in the format used by :func:`gron`, for example
+    ``.apps['mysql'].app_status.current``, and *path* is the same path as a tuple of field
+    names, dict keys, and list indexes, for example ``('apps', 'mysql', 'app_status',
+    'current')``.
+
+    If *omit_defaults* is true, dataclass fields set to their default are treated as
+    :data:`MISSING`, like :func:`gron` does.
+    """
+    same_type = type(old) is type(new)
+    if old is new or (same_type and old == new):
+        return
+
+    if dataclasses.is_dataclass(old) and same_type:
+        for field in dataclasses.fields(old):
+            old_v = getattr(old, field.name)
+            new_v = getattr(new, field.name)
+            if omit_defaults:
+                old_v = _non_default(field, old_v)
+                new_v = _non_default(field, new_v)
+            yield from changes(
+                old_v,
+                new_v,
+                f'{prefix}.{field.name}',
+                (*path, field.name),
+                omit_defaults=omit_defaults,
+            )
+
+    elif isinstance(old, list) and isinstance(new, list):
+        old_list = cast('list[object]', old)
+        new_list = cast('list[object]', new)
+        for i in range(max(len(old_list), len(new_list))):
+            old_v = old_list[i] if i < len(old_list) else MISSING
+            new_v = new_list[i] if i < len(new_list) else MISSING
+            yield from changes(
+                old_v, new_v, f'{prefix}[{i}]', (*path, i), omit_defaults=omit_defaults
+            )
+
+    elif isinstance(old, dict) and isinstance(new, dict):
+        old_dict = cast('dict[str, object]', old)
+        new_dict = cast('dict[str, object]', new)
+        for k in sorted(old_dict.keys() | new_dict.keys()):
+            old_v = old_dict.get(k, MISSING)
+            new_v = new_dict.get(k, MISSING)
+            yield from changes(
+                old_v, new_v, f'{prefix}[{k!r}]', (*path, k), omit_defaults=omit_defaults
+            )
+
+    else:
+        yield prefix, path, cast('object', old), new
+
+
+def _non_default(field: dataclasses.Field[object], value: object) -> object:
+    if field.default is not dataclasses.MISSING and value == field.default:
+        return MISSING
+    if field.default_factory is not dataclasses.MISSING and value == field.default_factory():
+        return MISSING
+    return value
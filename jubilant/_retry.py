@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Collection
+
+from . import _poll
+from ._poll import DelaySchedule
+
+# Substrings of Juju CLI error output that indicate a temporary problem talking to the
+# controller, rather than a problem with the command itself.
+_TRANSIENT_ERRORS = (
+    'connection is shut down',
+    'connection refused',
+    'connection reset by peer',
+    'i/o timeout',
+    'rate limit',
+    'too many requests',
+    'try again',
+    'unexpected eof',
+)
+
+_DEFAULT_BACKOFF = _poll.exponential_backoff(1.0, max_delay=10.0, jitter=0.1)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Policy for retrying Juju CLI commands that fail with a transient controller error.
+
+    Pass an instance to ``Juju(retry=...)`` to enable retries. By default, only read-only
+    commands such as ``juju status`` are retried, as retrying a command that changes the model
+    may repeat work if the first attempt partly succeeded. For example::
+
+        juju = jubilant.Juju(retry=jubilant.RetryPolicy())
+
+        # Also retry "juju config", which is safe to repeat.
+        juju = jubilant.Juju(retry=jubilant.RetryPolicy(commands={'status', 'config'}))
+
+    Each retry is logged at WARNING level to the ``jubilant`` logger and recorded by
+    :func:`collect_metrics`.
+    """
+
+    max_attempts: int = 3
+    """Maximum number of times to run a command, including the first attempt."""
+
+    backoff: DelaySchedule = _DEFAULT_BACKOFF
+    """Schedule for the delay before each retry. By default, 1s doubling up to 10s, with jitter.
+
+    This is called with the number of attempts made so far (and 0 as the second argument),
+    so :func:`exponential_backoff` may be used.
+    """
+
+    deadline: float = 60.0
+    """Don't start a retry more than this many seconds after the first attempt started."""
+
+    commands: Collection[str] | None = None
+    """Juju command names to retry, for example ``{'status', 'show-unit'}``.
+
+    If None, retry read-only commands, such as ``status``, ``show-unit``, and ``secrets``.
+    """
+
+    transient_errors: Collection[str] = _TRANSIENT_ERRORS
+    """Retry when the command's stderr contains one of these strings (ignoring case)."""
+
+    def _should_retry(self, command: str, read_only: bool, stderr: str) -> bool:
+        if self.commands is None:
+            if not read_only:
+                return False
+        elif command not in self.commands:
+            return False
+        stderr = stderr.lower()
+        return any(error.lower() in stderr for error in self.transient_errors)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import shutil
+import threading
+
+# Evict the least recently used files once the cache is bigger than this.
+_MAX_CACHE_BYTES = 4 * 1024 * 1024 * 1024
+
+# Map of (path, device, inode, size, mtime) to content hash, so that staging the same
+# unchanged file again doesn't need to read it.
+_hashes: dict[tuple[str, int, int, int, int], str] = {}
+_lock = threading.Lock()
+
+
+def stage(src: str, dst: str, cache_dir: str) -> None:
+    """Make the contents of *src* available at *dst*, without copying it on every call.
+
+    The first time a file's contents are staged, they're copied into *cache_dir*, named by
+    their SHA-256 hash. After that, *dst* is a hard link to the cached file, so staging the same
+    contents again (even from another :class:`Juju` instance or process) is nearly free. *dst*
+    must be on the same filesystem as *cache_dir* for this to help; otherwise it's copied.
+
+    The cache is shared by all processes using the same *cache_dir*. When it grows beyond a
+    size limit, the least recently used files are removed. Removing a cached file doesn't
+    affect existing hard links to it.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = os.path.join(cache_dir, _file_hash(src))
+    try:
+        os.utime(entry)  # mark as recently used
+    except FileNotFoundError:
+        _add_entry(src, entry)
+    try:
+        _link_or_copy(entry, dst)
+    except FileNotFoundError:
+        # Another process evicted the entry just now; stage directly instead.
+        shutil.copy(src, dst)
+    _evict(cache_dir, _MAX_CACHE_BYTES)
+
+
+def _file_hash(path: str) -> str:
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    with _lock:
+        digest = _hashes.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with _lock:
+            _hashes[key] = digest
+    return digest
+
+
+def _add_entry(src: str, entry: str) -> None:
+    # Copy (rather than hard link) the source, so that rebuilding it in place can't change
+    # the cached contents. Write to a temporary name first, as other processes may be
+    # staging the same file at the same time.
+    temp = f'{entry}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        shutil.copy(src, temp)
+        os.replace(temp, entry)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # Different filesystem, or the filesystem doesn't support hard links.
+        shutil.copy(src, dst)
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    entries: list[tuple[float, int, str]] = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for e in it:
+            if e.name.endswith('.tmp'):
+                continue
+            try:
+                st = e.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        total -= size
@@ -19,7 +19,7 @@ class TaskError(Exception):
         return f'task error: {self.task}'
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Task:
     """A task holds the results of Juju running an action or exec command on a single unit."""
 
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import itertools
 import logging
+import os
+import queue
 import secrets
 import subprocess
-from collections.abc import Generator, Mapping
+import threading
+from collections.abc import Generator, Mapping, Sequence
+from types import TracebackType
+from typing import Literal
 
+from . import _json, _metrics
 from ._juju import ConfigValue, Juju
 
 logger = logging.getLogger('jubilant')
@@ -18,6 +26,8 @@ def temp_model(
     cloud: str | None = None,
     config: Mapping[str, ConfigValue] | None = None,
     credential: str | None = None,
+    pool: ModelPool | None = None,
+    reaper: ModelReaper | None = None,
 ) -> Generator[Juju]:
     """Context manager to create a temporary model for running tests in.
 
@@ -48,25 +58,321 @@ def temp_model(
         config: Temporary model configuration as key-value pairs, for example,
             ``{'image-stream': 'daily'}``.
         credential: Name of cloud credential to use for the temporary model.
+        pool: If specified, take an already-created model from this pool, and return it to
+            the pool to be destroyed in the background when the context manager exits. The
+            model creation arguments (*controller* and so on) are specified when creating the
+            :class:`ModelPool` instead.
+        reaper: If specified, destroy the model in the background using this
+            :class:`ModelReaper` when the context manager exits, instead of waiting for it to
+            be destroyed.
     """
+    if pool is not None:
+        if any(arg is not None for arg in (controller, cloud, config, credential)):
+            raise TypeError('pass model creation arguments to ModelPool, not temp_model')
+        if reaper is not None:
+            raise TypeError('models from a ModelPool are always destroyed in the background')
+        juju = pool.get()
+        assert juju.model is not None
+        model = juju.model
+    else:
+        juju = Juju()
+        model = _random_model_name()
+    with _metrics.span('temp_model', 'model', model=model):
+        if pool is None:
+            juju.add_model(
+                model, cloud=cloud, controller=controller, config=config, credential=credential
+            )
+        try:
+            yield juju
+        finally:
+            if not keep:
+                if pool is not None:
+                    pool.release(juju)
+                elif reaper is not None:
+                    reaper.destroy(juju)
+                else:
+                    _destroy_model(juju)
+
+
+def select_controller(
+    controllers: Sequence[str],
+    *,
+    strategy: Literal['round-robin', 'least-loaded'] = 'round-robin',
+    worker_id: str | None = None,
+) -> str:
+    """Choose one of several controllers to create a temporary model on, to spread the load.
+
+    This is designed for running tests in parallel with pytest-xdist. For example::
+
+        CONTROLLERS = ['ctl-1', 'ctl-2', 'ctl-3']
+
+        @pytest.fixture(scope='module')
+        def juju():
+            controller = jubilant.select_controller(CONTROLLERS)
+            with jubilant.temp_model(controller=controller) as juju:
+                yield juju  # run the test
+
+    Args:
+        controllers: Names of the controllers to choose from. With the ``round-robin``
+            strategy, these may be any strings, such as cloud names.
+        strategy: With ``round-robin``, each xdist worker starts at a different controller
+            and moves to the next one for each call. With ``least-loaded``, choose the
+            controller with the fewest models (according to ``juju models``), breaking ties
+            as for ``round-robin``.
+        worker_id: The xdist worker ID, such as ``gw3``. If not specified, uses the
+            ``PYTEST_XDIST_WORKER`` environment variable (if set).
+    """
+    if not controllers:
+        raise ValueError('controllers must not be empty')
+    if worker_id is None:
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    digits = ''.join(c for c in worker_id or '' if c.isdigit())
+    start = int(digits) if digits else 0
+
+    n = len(controllers)
+    call = next(_select_calls)
+    if strategy == 'round-robin':
+        return controllers[(start + call) % n]
+    if strategy != 'least-loaded':
+        raise ValueError(f'invalid strategy {strategy!r}')
+
     juju = Juju()
-    model = 'jubilant-' + secrets.token_hex(4)  # 4 bytes (8 hex digits) should be plenty
-    juju.add_model(model, cloud=cloud, controller=controller, config=config, credential=credential)
+    counts: list[int] = []
+    for controller in controllers:
+        stdout = juju.cli('models', '--controller', controller, '--format', 'json')
+        counts.append(len(_json.loads(stdout).get('models') or []))
+    best = min(range(n), key=lambda i: (counts[i], (i - start - call) % n))
+    return controllers[best]
+
+
+_select_calls = itertools.count()
+
+
+class ModelReaper:
+    """Destroys models in background threads, for use with :func:`temp_model`.
+
+    Destroying a model can take several minutes. With ``temp_model(reaper=reaper)``, the model
+    is handed to the reaper when the ``with`` block exits, so the tests carry on while it's
+    destroyed. At the end of the session, use :meth:`join` (or exit the reaper's context) to
+    wait for all outstanding destroys, which logs a summary of any that failed or timed out.
+    For example, in ``conftest.py``::
+
+        @pytest.fixture(scope='session')
+        def model_reaper():
+            with jubilant.ModelReaper() as reaper:
+                yield reaper
+
+        @pytest.fixture(scope='module')
+        def juju(model_reaper: jubilant.ModelReaper):
+            with jubilant.temp_model(reaper=model_reaper) as juju:
+                yield juju  # run the test
+
+    Args:
+        max_workers: Maximum number of models to destroy at once.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='jubilant-model-reaper'
+        )
+        self._lock = threading.Lock()
+        self._destroyed: list[str] = []
+        self._failed: dict[str, str] = {}
+
+    def __enter__(self) -> ModelReaper:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.join()
+
+    def destroy(self, juju: Juju) -> None:
+        """Start destroying the model (and its storage) in the background."""
+        assert juju.model is not None
+        self._executor.submit(self._destroy, juju, juju.model)
+
+    def join(self) -> dict[str, str]:
+        """Wait for all outstanding destroys to finish, and log a summary.
+
+        Returns:
+            A mapping of model name to error message for each model that failed to be destroyed
+            or timed out. Empty if all models were destroyed successfully.
+        """
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            failed = dict(self._failed)
+            total = len(self._destroyed) + len(failed)
+        if failed:
+            lines = [f'  {model}: {error}' for model, error in sorted(failed.items())]
+            logger.error(
+                'failed to destroy %d of %d models:\n%s', len(failed), total, '\n'.join(lines)
+            )
+        elif total:
+            logger.info('destroyed %d models', total)
+        return failed
+
+    def _destroy(self, juju: Juju, model: str) -> None:
+        try:
+            _run_destroy_model(juju)
+        except subprocess.TimeoutExpired as exc:
+            error = f'timed out after {exc.timeout}s'
+        except Exception as exc:
+            error = str(exc).strip()
+        else:
+            with self._lock:
+                self._destroyed.append(model)
+            return
+        with self._lock:
+            self._failed[model] = error
+
+
+class ModelPool:
+    """Pool of models that are created in the background, for use with :func:`temp_model`.
+
+    Creating and destroying a model can take a while. A pool creates *size* models up front in
+    background threads, so that ``temp_model(pool=pool)`` can hand one out straight away. Each
+    time a model is handed out, the pool starts creating a replacement, and when a model is
+    returned (at the end of the ``with`` block), it's destroyed in the background rather than
+    blocking the test.
+
+    Use the pool as a context manager (or call :meth:`close`) to destroy the remaining models and
+    wait for all background work to finish. For example, in ``conftest.py``::
+
+        @pytest.fixture(scope='session')
+        def model_pool():
+            with jubilant.ModelPool(size=2) as pool:
+                yield pool
+
+        @pytest.fixture(scope='module')
+        def juju(model_pool: jubilant.ModelPool):
+            with jubilant.temp_model(pool=model_pool) as juju:
+                yield juju  # run the test
+
+    Args:
+        size: Number of models to keep ready.
+        controller: Name of controller where the models will be added.
+        cloud: Name of cloud or region (or cloud/region) to use for the models.
+        config: Model configuration as key-value pairs, for example,
+            ``{'image-stream': 'daily'}``.
+        credential: Name of cloud credential to use for the models.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        controller: str | None = None,
+        cloud: str | None = None,
+        config: Mapping[str, ConfigValue] | None = None,
+        credential: str | None = None,
+    ):
+        if size < 1:
+            raise ValueError(f'size must be at least 1, not {size}')
+        self._reaper = ModelReaper(max_workers=size)
+        self._controller = controller
+        self._cloud = cloud
+        self._config = config
+        self._credential = credential
+        self._closed = False
+        self._ready: queue.Queue[Juju | Exception] = queue.Queue()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix='jubilant-model-pool'
+        )
+        for _ in range(size):
+            self._executor.submit(self._add)
+
+    def __enter__(self) -> ModelPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def get(self, timeout: float | None = None) -> Juju:
+        """Take a model from the pool, waiting for one to be created if necessary.
+
+        This starts creating a replacement model in the background. Usually you'll use
+        ``temp_model(pool=pool)`` rather than calling this directly.
+
+        Raises:
+            TimeoutError: If no model is ready within *timeout* seconds.
+            CLIError: If creating the model failed.
+        """
+        if self._closed:
+            raise RuntimeError('model pool is closed')
+        try:
+            item = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f'no model ready after {timeout}s') from None
+        self._executor.submit(self._add)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def release(self, juju: Juju) -> None:
+        """Destroy a model taken from the pool, in the background."""
+        self._reaper.destroy(juju)
+
+    def close(self) -> None:
+        """Destroy the models that are ready, and wait for all background work to finish.
+
+        This logs a summary of any models that couldn't be destroyed.
+        """
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        while not self._ready.empty():
+            item = self._ready.get_nowait()
+            if isinstance(item, Juju):
+                self._reaper.destroy(item)
+        self._reaper.join()
+
+    def _add(self) -> None:
+        juju = Juju()
+        try:
+            juju.add_model(
+                _random_model_name(),
+                controller=self._controller,
+                cloud=self._cloud,
+                config=self._config,
+                credential=self._credential,
+            )
+        except Exception as exc:
+            logger.error('error creating model for pool: %s', exc)
+            self._ready.put(exc)
+            return
+        self._ready.put(juju)
+
+
+def _random_model_name() -> str:
+    return 'jubilant-' + secrets.token_hex(4)  # 4 bytes (8 hex digits) should be plenty
+
+
+def _run_destroy_model(juju: Juju) -> None:
+    """Destroy the model, raising TimeoutExpired if it takes longer than 10 minutes."""
+    assert juju.model is not None
+    # We're not using juju.destroy_model() here, as Juju doesn't provide a way
+    # to specify the timeout for the entire model destruction operation.
+    args = ['destroy-model', juju.model, '--no-prompt', '--destroy-storage', '--force']
+    juju._cli(*args, include_model=False, timeout=10 * 60)
+    juju.model = None
+
+
+def _destroy_model(juju: Juju) -> None:
+    """Destroy the model, logging an error if it takes longer than 10 minutes."""
     try:
-        yield juju
-    finally:
-        if not keep:
-            assert juju.model is not None
-            try:
-                # We're not using juju.destroy_model() here, as Juju doesn't provide a way
-                # to specify the timeout for the entire model destruction operation.
-                args = ['destroy-model', juju.model, '--no-prompt', '--destroy-storage', '--force']
-                juju._cli(*args, include_model=False, timeout=10 * 60)
-                juju.model = None
-            except subprocess.TimeoutExpired as exc:
-                logger.error(
-                    'timeout destroying model: %s\nStdout:\n%s\nStderr:\n%s',
-                    exc,
-                    exc.stdout,
-                    exc.stderr,
-                )
+        _run_destroy_model(juju)
+    except subprocess.TimeoutExpired as exc:
+        logger.error(
+            'timeout destroying model: %s\nStdout:\n%s\nStderr:\n%s',
+            exc,
+            exc.stdout,
+            exc.stderr,
+        )
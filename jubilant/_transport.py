@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import collections
+import json
+import os
+import subprocess
+import threading
+from typing import Any, Protocol
+
+
+class Transport(Protocol):
+    """Interface for running Juju CLI commands, for use with ``Juju(transport=...)``.
+
+    The default transport, :class:`SubprocessTransport`, runs the Juju CLI with
+    :func:`subprocess.run`. Other transports can record commands, replay previously recorded
+    output, or run commands some other way.
+    """
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a command and return its result.
+
+        This must not raise an exception if the command returns a nonzero exit code; the caller
+        checks the *returncode* attribute of the result.
+
+        Args:
+            args: Command-line arguments, including the Juju CLI binary as the first item.
+            stdin: Standard input to send to the command.
+            timeout: Timeout in seconds. If the command takes longer, raise
+                :class:`subprocess.TimeoutExpired`.
+        """
+        ...
+
+
+class SubprocessTransport:
+    """Transport that runs the Juju CLI in a subprocess (the default)."""
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run the command using :func:`subprocess.run`."""
+        try:
+            return subprocess.run(
+                args,
+                check=True,
+                capture_output=True,
+                encoding='utf-8',
+                input=stdin,
+                timeout=timeout,
+            )
+        except subprocess.CalledProcessError as e:
+            return subprocess.CompletedProcess(args, e.returncode, e.stdout, e.stderr)
+
+
+class RecordingTransport:
+    """Transport that records each command and its result to a transcript file.
+
+    The transcript can later be replayed with :class:`ReplayTransport`, for example to profile
+    Jubilant's parsing and waiting logic against real captured traffic, without a controller::
+
+        juju = jubilant.Juju(transport=jubilant.RecordingTransport('transcript.jsonl'))
+
+    The transcript is a JSON Lines file with one command per line. Commands are appended to the
+    file if it already exists.
+
+    Args:
+        path: Path of the transcript file to write.
+        transport: Transport used to run the commands. Defaults to :class:`SubprocessTransport`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], transport: Transport | None = None):
+        self.path = path
+        self.transport = transport or SubprocessTransport()
+        self._lock = threading.Lock()
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run the command using the wrapped transport, and record it and its result."""
+        process = self.transport.run(args, stdin=stdin, timeout=timeout)
+        entry = {
+            'args': args,
+            'stdin': stdin,
+            'returncode': process.returncode,
+            'stdout': process.stdout,
+            'stderr': process.stderr,
+        }
+        line = json.dumps(entry) + '\n'
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+        return process
+
+
+class ReplayTransport:
+    """Transport that replays command output recorded by :class:`RecordingTransport`.
+
+    Each time a command is run, the next recorded result for the same arguments is returned,
+    in the order they were recorded. After the last recorded result for a command, that result
+    is returned again for any further calls, so polling loops like :meth:`Juju.wait` settle on
+    the final recorded status.
+
+    Commands that include temporary file names, such as :meth:`Juju.run` with *params*, won't
+    match their recording, as the file name is different each run. Similarly,
+    ``juju.wait(..., watch=True)`` always runs the Juju CLI, as it doesn't use the transport.
+
+    Args:
+        path: Path of the transcript file to read.
+
+    Raises:
+        ValueError: When running a command that isn't in the transcript.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = path
+        self._results: dict[tuple[str, ...], collections.deque[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = tuple(entry['args'])
+                self._results.setdefault(key, collections.deque()).append(entry)
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Return the next recorded result for the command."""
+        with self._lock:
+            results = self._results.get(tuple(args))
+            if not results:
+                raise ValueError(f'no recorded result for command {args}')
+            entry = results.popleft() if len(results) > 1 else results[0]
+        return subprocess.CompletedProcess(
+            args, entry['returncode'], entry['stdout'], entry['stderr']
+        )
@@ -25,7 +25,7 @@ majmin_tag_build_re = re.compile(rf'{majmin}-([a-z]+)(\d+)\.(\d+)-{relarch}')
 _tuple = tuple
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Version:
     """Parsed Juju CLI version as returned by ``juju version --format=json --all``.
 
@@ -10,7 +10,7 @@ import dataclasses
 from typing import Any
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelCredential:
     name: str
     owner: str
@@ -28,7 +28,7 @@ class ModelCredential:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelStatusInfo:
     current: str = ''
     message: str = ''
@@ -51,7 +51,7 @@ class ModelStatusInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelUserInfo:
     access: str
     last_connection: str
@@ -67,7 +67,7 @@ class ModelUserInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelMachineInfo:
     cores: int
 
@@ -78,7 +78,7 @@ class ModelMachineInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SecretBackendInfo:
     num_secrets: int
     status: str
@@ -94,7 +94,7 @@ class SecretBackendInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SupportedFeature:
     name: str
     description: str
@@ -110,7 +110,7 @@ class SupportedFeature:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelInfo:
     """Parsed version of the object returned by ``juju show-model --format=json``."""
 
@@ -31,7 +31,7 @@ class SecretURI(str):
             return str(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Secret:
     """Represents a secret."""
 
@@ -69,7 +69,7 @@ class Secret:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RevealedSecret(Secret):
     """Represents a secret that was revealed, which has a content field that's populated."""
 
@@ -81,7 +81,7 @@ class RevealedSecret(Secret):
 
     @classmethod
     def _from_dict(cls, d: dict[str, Any]) -> RevealedSecret:
-        kwargs = dataclasses.asdict(super()._from_dict(d))
+        kwargs = dataclasses.asdict(Secret._from_dict(d))
         return RevealedSecret(
             # Secret content checksums were introduced in Juju 3.6.0
             content=d['content']['Data'],
@@ -90,7 +90,7 @@ class RevealedSecret(Secret):
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Revision:
     """Represents a revision of a secret."""
 
@@ -111,7 +111,7 @@ class Revision:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Access:
     """Represents access to a secret."""
 
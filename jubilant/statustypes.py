@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import dataclasses
+from collections.abc import Generator
 from typing import Any
 
 from . import _pretty
@@ -39,6 +40,7 @@ __all__ = [
     'RemoteAppStatus',
     'RemoteEndpoint',
     'Status',
+    'StatusChange',
     'StatusInfo',
     'StorageAttachments',
     'StorageInfo',
@@ -50,7 +52,7 @@ __all__ = [
 ]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class FormattedBase:
     name: str
     channel: str
@@ -63,7 +65,7 @@ class FormattedBase:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class StatusInfo:
     """The main status class used for application, unit, and machine status."""
 
@@ -88,7 +90,7 @@ class StatusInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AppStatusRelation:
     related_app: str = ''
     interface: str = ''
@@ -103,7 +105,7 @@ class AppStatusRelation:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class UnitStatus:
     """Status of a single unit."""
 
@@ -172,7 +174,7 @@ class UnitStatus:
         return self.workload_status.current == 'waiting'
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AppStatus:
     """Status of a single application."""
 
@@ -265,7 +267,7 @@ class AppStatus:
         return self.app_status.current == 'waiting'
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EntityStatus:
     """Status class used for storage status. See :class:`StatusInfo` for the main status class."""
 
@@ -282,7 +284,7 @@ class EntityStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class UnitStorageAttachment:
     machine: str = ''
     location: str = ''
@@ -297,7 +299,7 @@ class UnitStorageAttachment:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class StorageAttachments:
     units: dict[str, UnitStorageAttachment]
 
@@ -308,7 +310,7 @@ class StorageAttachments:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class StorageInfo:
     kind: str
     status: EntityStatus
@@ -330,7 +332,7 @@ class StorageInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class FilesystemAttachment:
     mount_point: str
     read_only: bool
@@ -346,7 +348,7 @@ class FilesystemAttachment:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class FilesystemAttachments:
     machines: dict[str, FilesystemAttachment] = dataclasses.field(default_factory=dict)  # type: ignore
     containers: dict[str, FilesystemAttachment] = dataclasses.field(default_factory=dict)  # type: ignore
@@ -365,7 +367,7 @@ class FilesystemAttachments:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class FilesystemInfo:
     size: int
 
@@ -395,7 +397,7 @@ class FilesystemInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VolumeAttachment:
     read_only: bool
 
@@ -415,7 +417,7 @@ class VolumeAttachment:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VolumeAttachments:
     machines: dict[str, VolumeAttachment] = dataclasses.field(default_factory=dict)  # type: ignore
     containers: dict[str, VolumeAttachment] = dataclasses.field(default_factory=dict)  # type: ignore
@@ -432,7 +434,7 @@ class VolumeAttachments:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VolumeInfo:
     size: int
     persistent: bool
@@ -466,7 +468,7 @@ class VolumeInfo:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CombinedStorage:
     """Storage information."""
 
@@ -485,7 +487,7 @@ class CombinedStorage:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ControllerStatus:
     """Basic controller information."""
 
@@ -498,7 +500,7 @@ class ControllerStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LxdProfileContents:
     config: dict[str, str]
     description: str
@@ -513,7 +515,7 @@ class LxdProfileContents:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class NetworkInterface:
     ip_addresses: list[str]
     mac_address: str
@@ -535,7 +537,7 @@ class NetworkInterface:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MachineStatus:
     """Status of a single machine."""
 
@@ -600,7 +602,7 @@ class MachineStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ModelStatus:
     """Status and basic information about the model."""
 
@@ -644,7 +646,7 @@ class ModelStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RemoteEndpoint:
     interface: str
     role: str
@@ -657,7 +659,7 @@ class RemoteEndpoint:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class OfferStatus:
     app: str
     endpoints: dict[str, RemoteEndpoint]
@@ -679,7 +681,7 @@ class OfferStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RemoteAppStatus:
     url: str
 
@@ -708,7 +710,7 @@ class RemoteAppStatus:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Status:
     """Parsed version of the status object returned by ``juju status --format=json``."""
 
@@ -777,6 +779,37 @@ class Status:
                 return False
         return True
 
+    def diff(self, other: Status) -> Generator[StatusChange]:
+        """Yield the changes from this status to *other*, such as a unit's status changing.
+
+        This walks the two statuses in parallel and skips parts that are equal, so it's fast even
+        for large models. Like ``==``, this ignores the :attr:`controller` attribute.
+
+        Each change is reported at the highest level possible. For example, if *other* has a new
+        application, the change's :attr:`StatusChange.new` is that application's
+        :class:`AppStatus`, rather than there being a change for each of its fields.
+
+        Example::
+
+            for change in prev_status.diff(status):
+                if change.path[-2:] == ('workload_status', 'current') and change.new == 'error':
+                    print(f'unit {change.path[3]} went into error')
+        """
+        for field in dataclasses.fields(self):
+            if field.name == 'controller':
+                continue
+            for _, path, old, new in _pretty.changes(
+                getattr(self, field.name),
+                getattr(other, field.name),
+                f'.{field.name}',
+                (field.name,),
+            ):
+                yield StatusChange(
+                    path=path,
+                    old=None if old is _pretty.MISSING else old,
+                    new=None if new is _pretty.MISSING else new,
+                )
+
     def get_units(self, app: str) -> dict[str, UnitStatus]:
         """Get all units of the given *app*, including units of subordinate apps.
 
@@ -802,3 +835,20 @@ class Status:
                     if sub_name.startswith(app_prefix):
                         units[sub_name] = sub  # noqa: PERF403
         return units
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StatusChange:
+    """A single change between two statuses, as returned by :meth:`Status.diff`."""
+
+    path: tuple[str | int, ...]
+    """Path to the changed value: attribute names, dict keys, and list indexes.
+
+    For example, ``('apps', 'mysql', 'units', 'mysql/0', 'workload_status', 'current')``.
+    """
+
+    old: Any
+    """Value in the old status, or None if it was added."""
+
+    new: Any
+    """Value in the new status, or None if it was removed."""
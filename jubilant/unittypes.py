@@ -10,7 +10,7 @@ import dataclasses
 from typing import Any
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class UnitRelationData:
     in_scope: bool
     data: dict[str, Any]
@@ -23,7 +23,7 @@ class UnitRelationData:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RelationData:
     relation_id: int
     endpoint: str
@@ -49,7 +49,7 @@ class RelationData:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class UnitInfo:
     opened_ports: list[str]
     charm: str
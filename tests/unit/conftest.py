@@ -46,3 +46,11 @@ def juju_non_snap(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setattr('shutil.which', lambda _: '/snap/bin/juju')
     """
     monkeypatch.setattr('shutil.which', lambda _: '/bin/juju')  # type: ignore
+
+
+@pytest.fixture
+def popen(monkeypatch: pytest.MonkeyPatch) -> Generator[mocks.Popen]:
+    """Pytest fixture that patches subprocess.Popen with mocks.Popen."""
+    popen_mock = mocks.Popen()
+    monkeypatch.setattr('subprocess.Popen', popen_mock)
+    yield popen_mock
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import subprocess
+import threading
 from typing import Any
 
 
@@ -140,3 +141,91 @@ class NamedTemporaryFile:
 
     def flush(self) -> None:
         self.num_flushes += 1
+
+
+class Popen:
+    """Mock for subprocess.Popen.
+
+    Each call starts a fake process whose stdout yields the lines passed to
+    :meth:`handle` for those command-line arguments, then exits with the given
+    return code. If *block* is true, the process keeps running after the last
+    line until it's terminated. The arguments of each call are recorded in *calls*.
+    """
+
+    def __init__(self):
+        self._commands: dict[tuple[str, ...], tuple[int, list[str], bool]] = {}
+        self.calls: list[tuple[str, ...]] = []
+        self.processes: list[PopenProcess] = []
+
+    def handle(
+        self,
+        args: list[str],
+        *,
+        returncode: int = 0,
+        lines: list[str] | None = None,
+        block: bool = False,
+    ):
+        """Handle specified command-line args with the given return code and stdout lines."""
+        self._commands[tuple(args)] = (returncode, lines or [], block)
+
+    def __call__(self, args: list[str], **kwargs: Any) -> PopenProcess:
+        args_tuple = tuple(args)
+        assert args_tuple in self._commands, f'unhandled command {args}'
+        returncode, lines, block = self._commands[args_tuple]
+        self.calls.append(args_tuple)
+        process = PopenProcess(returncode, lines, block)
+        self.processes.append(process)
+        return process
+
+
+class PopenProcess:
+    """Fake process returned by :class:`Popen`."""
+
+    def __init__(self, returncode: int, lines: list[str], block: bool):
+        self.stdout = PopenStdout(lines, block)
+        self.returncode: int | None = None
+        self._exit_code = returncode
+        self.terminated = False
+
+    def poll(self) -> int | None:
+        if self.stdout.exhausted:
+            self.returncode = self._exit_code
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        self.returncode = self._exit_code if not self.terminated else -15
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.stdout.exhausted = True
+        self.stdout.unblock.set()
+
+    def kill(self) -> None:
+        self.terminate()
+
+
+class PopenStdout:
+    """Fake stdout pipe of a :class:`PopenProcess`."""
+
+    def __init__(self, lines: list[str], block: bool):
+        self._lines = list(lines)
+        self.exhausted = False
+        self.closed = False
+        self.unblock = threading.Event()
+        if not block:
+            self.unblock.set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self._lines:
+            self.unblock.wait()
+        if not self._lines or self.exhausted:
+            self.exhausted = True
+            raise StopIteration
+        return self._lines.pop(0)
+
+    def close(self) -> None:
+        self.closed = True
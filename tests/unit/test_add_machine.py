@@ -1,4 +1,8 @@
+import os
 import pathlib
+import subprocess
+
+import pytest
 
 import jubilant
 
@@ -104,3 +108,27 @@ def test_keys_pathlib(run: mocks.Run):
         private_key=pathlib.Path('/keys/id_ed25519'),
         public_key=pathlib.Path('/keys/id_ed25519.pub'),
     )
+
+
+def test_keys_snap_not_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr('shutil.which', lambda _: '/snap/bin/juju')  # type: ignore
+    monkeypatch.setattr('os.path.expanduser', lambda _: str(tmp_path / 'common'))  # type: ignore
+    (tmp_path / 'id_ed25519').write_text('PRIVATE')
+    (tmp_path / 'id_ed25519.pub').write_text('PUBLIC')
+
+    def mock_run(args: list[str], **_: object):
+        assert pathlib.Path(args[4]).read_text() == 'PRIVATE'
+        assert pathlib.Path(args[6]).read_text() == 'PUBLIC'
+        return subprocess.CompletedProcess(args, 0, '', '')
+
+    monkeypatch.setattr('subprocess.run', mock_run)
+    juju = jubilant.Juju()
+
+    juju.add_machine(
+        'ssh:user@10.10.0.3',
+        private_key=tmp_path / 'id_ed25519',
+        public_key=tmp_path / 'id_ed25519.pub',
+    )
+
+    # Keys are only copied to a temporary directory, never into the staging cache.
+    assert os.listdir(tmp_path / 'common') == []
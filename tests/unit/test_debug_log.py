@@ -25,3 +25,107 @@ def test_limit(run: mocks.Run):
     juju = jubilant.Juju()
     logs = juju.debug_log(limit=10)
     assert logs == 'out'
+
+
+def test_filters(run: mocks.Run):
+    run.handle(
+        [
+            'juju',
+            'debug-log',
+            '--limit',
+            '5',
+            '--include',
+            'mysql/*',
+            '--include',
+            'pg',
+            '--exclude',
+            'mysql/1',
+            '--include-module',
+            'unit.mysql',
+            '--exclude-module',
+            'juju.worker',
+            '--level',
+            'ERROR',
+            '--replay',
+        ],
+        stdout='out',
+    )
+
+    juju = jubilant.Juju()
+    logs = juju.debug_log(
+        limit=5,
+        include=['mysql/*', 'pg'],
+        exclude='mysql/1',
+        level='ERROR',
+        include_module='unit.mysql',
+        exclude_module=['juju.worker'],
+        replay=True,
+    )
+    assert logs == 'out'
+
+
+def test_stream_filters(popen: mocks.Popen):
+    popen.handle([
+        'juju',
+        'debug-log',
+        '--tail',
+        '--lines',
+        '10',
+        '--include',
+        'mysql',
+        '--level',
+        'INFO',
+    ])
+
+    juju = jubilant.Juju()
+    with juju.debug_log_stream(include='mysql', level='INFO') as log:
+        assert list(log) == []
+
+
+LOG = """\
+controller-0: 14:20:04 INFO juju.worker.apicaller [abc123] "controller-0" successfully connected
+unit-mysql-0: 2025-01-02 14:20:05.123 ERROR unit.mysql/0.juju-log Uncaught exception
+Traceback (most recent call last):
+  File "./src/charm.py", line 1, in <module>
+machine-0: 14:20:06 DEBUG juju.worker.dependency
+"""
+
+
+def test_parse():
+    entries = jubilant.parse_debug_log(LOG)
+
+    assert entries == [
+        jubilant.LogEntry(
+            entity='controller-0',
+            timestamp='14:20:04',
+            level='INFO',
+            module='juju.worker.apicaller',
+            message='[abc123] "controller-0" successfully connected',
+        ),
+        jubilant.LogEntry(
+            entity='unit-mysql-0',
+            timestamp='2025-01-02 14:20:05.123',
+            level='ERROR',
+            module='unit.mysql/0.juju-log',
+            message=(
+                'Uncaught exception\n'
+                'Traceback (most recent call last):\n'
+                '  File "./src/charm.py", line 1, in <module>'
+            ),
+        ),
+        jubilant.LogEntry(
+            entity='machine-0',
+            timestamp='14:20:06',
+            level='DEBUG',
+            module='juju.worker.dependency',
+            message='',
+        ),
+    ]
+
+
+def test_parse_lines():
+    lines = ['junk before first entry\n', 'unit-a-0: 10:00:00 WARNING m hello\n']
+
+    entries = jubilant.parse_debug_log(lines)
+
+    assert entries == [jubilant.LogEntry('unit-a-0', '10:00:00', 'WARNING', 'm', 'hello')]
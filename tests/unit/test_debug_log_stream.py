@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+import jubilant
+
+from . import mocks
+
+
+def test_iterate(popen: mocks.Popen):
+    popen.handle(
+        ['juju', 'debug-log', '--tail', '--lines', '10'],
+        lines=['line 1\n', 'line 2\n', 'line 3\n'],
+    )
+    juju = jubilant.Juju()
+
+    with juju.debug_log_stream() as log:
+        assert list(log) == ['line 1', 'line 2', 'line 3']
+        assert log.recent() == ['line 1', 'line 2', 'line 3']
+        assert not log.running
+
+    assert popen.processes[0].stdout.closed
+
+
+def test_args(popen: mocks.Popen):
+    popen.handle(['juju', 'debug-log', '--model', 'mdl', '--tail', '--replay'])
+    popen.handle(['juju', 'debug-log', '--model', 'mdl', '--tail', '--lines', '0'])
+    juju = jubilant.Juju(model='mdl')
+
+    with juju.debug_log_stream(replay=True) as log:
+        assert list(log) == []
+    with juju.debug_log_stream(lines=0) as log:
+        assert list(log) == []
+
+    assert len(popen.calls) == 2
+
+
+def test_keep(popen: mocks.Popen):
+    popen.handle(
+        ['juju', 'debug-log', '--tail', '--lines', '10'],
+        lines=[f'line {i}\n' for i in range(10)],
+    )
+    juju = jubilant.Juju()
+
+    with juju.debug_log_stream(keep=3) as log:
+        log._thread.join()  # let the reader fall behind
+        assert log.recent() == ['line 7', 'line 8', 'line 9']
+        assert list(log) == ['line 7', 'line 8', 'line 9']
+        assert log.dropped == 7
+        # Iterating a finished stream again returns immediately.
+        assert list(log) == []
+
+
+def test_close_stops_process(popen: mocks.Popen):
+    popen.handle(['juju', 'debug-log', '--tail', '--lines', '10'], lines=['a\n'], block=True)
+    juju = jubilant.Juju()
+
+    with juju.debug_log_stream() as log:
+        assert next(iter(log)) == 'a'
+        assert log.running
+
+    assert popen.processes[0].terminated
+    assert log.recent() == ['a']
+
+
+def test_invalid_keep():
+    juju = jubilant.Juju()
+
+    with pytest.raises(ValueError):
+        juju.debug_log_stream(keep=0)
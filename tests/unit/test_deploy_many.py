@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import pathlib
+from typing import Any
+
+import pytest
+import yaml
+
+import jubilant
+
+from . import mocks
+
+
+def test_bundle(run: mocks.Run, mock_file: mocks.NamedTemporaryFile):
+    run.handle(['juju', 'deploy', '--model', 'mdl', mock_file.name, '--force', '--trust'])
+    juju = jubilant.Juju(model='mdl')
+
+    juju.deploy_many(
+        {
+            'mysql-k8s': {'channel': '8.0/stable', 'trust': True},
+            'wp': {'charm': 'wordpress', 'num_units': 2, 'options': {'debug': True}},
+        },
+        relations=[('wp:db', 'mysql-k8s:database'), ('wp', 'ingress')],
+        force=True,
+        trust=True,
+    )
+
+    assert yaml.safe_load(''.join(mock_file.writes)) == {
+        'applications': {
+            'mysql-k8s': {'charm': 'mysql-k8s', 'channel': '8.0/stable', 'trust': True},
+            'wp': {'charm': 'wordpress', 'num_units': 2, 'options': {'debug': True}},
+        },
+        'relations': [['wp:db', 'mysql-k8s:database'], ['wp', 'ingress']],
+    }
+    assert mock_file.num_flushes == 1
+    assert len(run.calls) == 1
+
+
+def test_local_paths(run: mocks.Run, mock_file: mocks.NamedTemporaryFile):
+    run.handle(['juju', 'deploy', mock_file.name])
+    juju = jubilant.Juju()
+
+    juju.deploy_many({
+        'a': {'charm': pathlib.Path('a.charm'), 'resources': {'img': './img.tar', 'x': 'rev3'}},
+        'b': {'charm': '/abs/b.charm'},
+    })
+
+    bundle = yaml.safe_load(''.join(mock_file.writes))
+    assert bundle == {
+        'applications': {
+            'a': {
+                'charm': os.path.abspath('a.charm'),
+                'resources': {'img': os.path.abspath('img.tar'), 'x': 'rev3'},
+            },
+            'b': {'charm': '/abs/b.charm'},
+        },
+    }
+
+
+def test_resource_revisions(run: mocks.Run, mock_file: mocks.NamedTemporaryFile):
+    run.handle(['juju', 'deploy', mock_file.name])
+    juju = jubilant.Juju()
+
+    juju.deploy_many({
+        'mysql': {'resources': {'mysql-image': 113, 'img': pathlib.Path('img.tar')}},
+    })
+
+    bundle = yaml.safe_load(''.join(mock_file.writes))
+    assert bundle['applications']['mysql']['resources'] == {
+        'mysql-image': 113,
+        'img': os.path.abspath('img.tar'),
+    }
+
+
+def test_secret_uri_options(run: mocks.Run, mock_file: mocks.NamedTemporaryFile):
+    run.handle(['juju', 'deploy', mock_file.name])
+    juju = jubilant.Juju()
+    uri = jubilant.SecretURI('secret:abc123')
+
+    juju.deploy_many({'app': {'options': {'password': uri, 'port': 8080}}})
+
+    bundle = yaml.safe_load(''.join(mock_file.writes))
+    assert bundle['applications']['app']['options'] == {
+        'password': 'secret:abc123',
+        'port': 8080,
+    }
+
+
+def test_snap(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr('shutil.which', lambda _: '/snap/bin/juju')  # type: ignore
+    monkeypatch.setattr('os.path.expanduser', lambda _: str(tmp_path))  # type: ignore
+    charm = tmp_path / 'src' / 'a.charm'
+    charm.parent.mkdir()
+    charm.write_text('CHARM')
+    bundles: list[dict[str, object]] = []
+
+    def mock_cli(*args: str, **kwargs: object):
+        assert args[0] == 'deploy'
+        bundle = yaml.safe_load(pathlib.Path(args[1]).read_text())
+        staged = pathlib.Path(bundle['applications']['a']['charm'])
+        assert staged.is_relative_to(tmp_path)
+        assert staged != charm
+        assert staged.read_text() == 'CHARM'
+        bundles.append(bundle)
+        return ''
+
+    juju = jubilant.Juju()
+    monkeypatch.setattr(juju, 'cli', mock_cli)
+
+    juju.deploy_many({'a': {'charm': charm}})
+
+    assert len(bundles) == 1
+
+
+def test_snap_resource_revisions(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr('shutil.which', lambda _: '/snap/bin/juju')  # type: ignore
+    monkeypatch.setattr('os.path.expanduser', lambda _: str(tmp_path))  # type: ignore
+    image = tmp_path / 'src' / 'image.tar'
+    image.parent.mkdir()
+    image.write_text('IMAGE')
+    bundles: list[dict[str, Any]] = []
+
+    def mock_cli(*args: str, **kwargs: object):
+        bundle = yaml.safe_load(pathlib.Path(args[1]).read_text())
+        staged = pathlib.Path(bundle['applications']['a']['resources']['img'])
+        assert staged.read_text() == 'IMAGE'
+        bundles.append(bundle)
+        return ''
+
+    juju = jubilant.Juju()
+    monkeypatch.setattr(juju, 'cli', mock_cli)
+
+    juju.deploy_many({'a': {'resources': {'img': image, 'other': 7}}})
+
+    assert len(bundles) == 1
+    assert bundles[0]['applications']['a']['resources']['other'] == 7
@@ -0,0 +1,170 @@
+import json
+
+import pytest
+
+import jubilant
+
+from . import mocks
+
+OUT_JSON = r"""
+{
+  "ubuntu/0": {
+    "id": "28",
+    "results": {
+      "return-code": 0,
+      "stdout": "foo\n"
+    },
+    "status": "completed",
+    "unit": "ubuntu/0"
+  },
+  "ubuntu/1": {
+    "id": "29",
+    "results": {
+      "return-code": 1,
+      "stderr": "bar\n"
+    },
+    "status": "completed",
+    "unit": "ubuntu/1"
+  }
+}
+"""
+
+
+def test_units(run: mocks.Run):
+    run.handle(
+        [
+            'juju',
+            'exec',
+            '--format',
+            'json',
+            '--unit',
+            'ubuntu/0,ubuntu/1',
+            '--',
+            'echo',
+            'foo',
+        ],
+        returncode=1,
+        stdout=OUT_JSON,
+        stderr='task failed',
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.exec_multiple('echo', 'foo', unit=['ubuntu/0', 'ubuntu/1'])
+
+    assert tasks == {
+        'ubuntu/0': jubilant.Task(id='28', status='completed', stdout='foo\n'),
+        'ubuntu/1': jubilant.Task(id='29', status='completed', return_code=1, stderr='bar\n'),
+    }
+    assert tasks['ubuntu/0'].success
+    assert not tasks['ubuntu/1'].success
+
+
+def test_several_failed(run: mocks.Run):
+    out = json.loads(OUT_JSON)
+    out['ubuntu/0']['results'] = {'return-code': 2, 'stderr': 'baz\n'}
+    run.handle(
+        ['juju', 'exec', '--format', 'json', '--application', 'ubuntu', '--', 'check'],
+        returncode=1,
+        stdout=json.dumps(out),
+        stderr='ERROR the following tasks failed:\n - id "28" with return code 2\n'
+        ' - id "29" with return code 1\n\nuse \'juju show-task\' to inspect the failures\n',
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.exec_multiple('check', app='ubuntu')
+
+    assert tasks == {
+        'ubuntu/0': jubilant.Task(id='28', status='completed', return_code=2, stderr='baz\n'),
+        'ubuntu/1': jubilant.Task(id='29', status='completed', return_code=1, stderr='bar\n'),
+    }
+
+
+def test_app(run: mocks.Run):
+    run.handle(
+        ['juju', 'exec', '--format', 'json', '--application', 'ubuntu', '--', 'echo foo'],
+        stdout=OUT_JSON,
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.exec_multiple('echo foo', app='ubuntu')
+
+    assert list(tasks) == ['ubuntu/0', 'ubuntu/1']
+
+
+def test_all_targets(run: mocks.Run):
+    run.handle(
+        [
+            'juju',
+            'exec',
+            '--model',
+            'mdl',
+            '--format',
+            'json',
+            '--application',
+            'a,b',
+            '--machine',
+            '0,0/lxd/0',
+            '--unit',
+            'c/0',
+            '--wait',
+            '10s',
+            '--',
+            'echo',
+        ],
+        stdout=OUT_JSON,
+    )
+    juju = jubilant.Juju(model='mdl')
+
+    tasks = juju.exec_multiple('echo', app=['a', 'b'], machine=[0, '0/lxd/0'], unit='c/0', wait=10)
+
+    assert len(tasks) == 2
+
+
+def test_machine_int(run: mocks.Run):
+    run.handle(
+        ['juju', 'exec', '--format', 'json', '--machine', '3', '--', 'echo'],
+        stdout=OUT_JSON,
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.exec_multiple('echo', machine=3)
+
+    assert len(tasks) == 2
+
+
+def test_wait_timeout(run: mocks.Run):
+    run.handle(
+        [
+            'juju',
+            'exec',
+            '--format',
+            'json',
+            '--application',
+            'ubuntu',
+            '--wait',
+            '0.001s',
+            '--',
+            'sleep 1',
+        ],
+        returncode=1,
+        stdout='OUT',
+        stderr='... timed out ...',
+    )
+    juju = jubilant.Juju()
+
+    with pytest.raises(TimeoutError):
+        juju.exec_multiple('sleep 1', app='ubuntu', wait=0.001)
+
+
+def test_not_found(run: mocks.Run):
+    run.handle(['juju', 'exec', '--format', 'json', '--application', 'x', '--', 'echo'])
+    juju = jubilant.Juju()
+
+    with pytest.raises(ValueError):
+        juju.exec_multiple('echo', app='x')
+
+
+def test_type_errors():
+    juju = jubilant.Juju()
+    with pytest.raises(TypeError):
+        juju.exec_multiple('echo')
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import types
+
+import pytest
+
+from jubilant import _json
+
+
+def test_loads():
+    assert _json.loads('{"a": [1, 2.5, "x", null, true]}') == {'a': [1, 2.5, 'x', None, True]}
+    assert _json.loads(b'{"a": "\xc3\xa9"}') == {'a': 'é'}
+
+
+def test_loads_stdlib(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_json, '_loads', json.loads)
+
+    assert _json.loads('{"a": 1}') == {'a': 1}
+    with pytest.raises(ValueError):
+        _json.loads('{')
+
+
+def test_orjson_missing(monkeypatch: pytest.MonkeyPatch):
+    def import_module(name: str):
+        raise ImportError(name)
+
+    monkeypatch.setattr('importlib.import_module', import_module)
+
+    assert _json._orjson_loads() is None
+
+
+def test_orjson_used(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str | bytes] = []
+
+    def loads(s: str | bytes):
+        calls.append(s)
+        return {'fake': True}
+
+    def import_module(name: str):
+        assert name == 'orjson'
+        return types.SimpleNamespace(loads=loads)
+
+    monkeypatch.setattr('importlib.import_module', import_module)
+    monkeypatch.setattr(_json, '_loads', _json._orjson_loads())
+
+    assert _json.loads('{"a": 1}') == {'fake': True}
+    assert calls == ['{"a": 1}']
+
+
+def test_orjson_real():
+    orjson = pytest.importorskip('orjson')
+
+    assert _json._loads is orjson.loads
+    assert _json.loads('{"a": [1, 2.5, null]}') == {'a': [1, 2.5, None]}
+    with pytest.raises(ValueError):
+        _json.loads('{')
@@ -59,3 +59,9 @@ def test_snap_tempdir(monkeypatch: pytest.MonkeyPatch):
     juju = jubilant.Juju()
 
     assert 'snap' in juju._temp_dir
+
+
+def test_repr_status_ttl():
+    juju = jubilant.Juju(model='m', status_ttl=2.5)
+
+    assert repr(juju) == "Juju(model='m', wait_timeout=180.0, cli_binary='juju', status_ttl=2.5)"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import concurrent.futures
+import pathlib
+import subprocess
+import threading
+import time
+from collections.abc import Generator
+
+import pytest
+
+import jubilant
+from jubilant import _limits
+
+
+@pytest.fixture(autouse=True)
+def reset_limits() -> Generator[None]:
+    yield
+    jubilant.limit_concurrency()
+
+
+class CountingTransport:
+    """Transport that tracks the maximum number of concurrent read and write commands."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {'read': 0, 'write': 0}
+        self.max_running = {'read': 0, 'write': 0}
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        kind = 'read' if args[1] == 'status' else 'write'
+        with self.lock:
+            self.running[kind] += 1
+            self.max_running[kind] = max(self.max_running[kind], self.running[kind])
+        time.sleep(0.01)
+        with self.lock:
+            self.running[kind] -= 1
+        return subprocess.CompletedProcess(args, 0, '', '')
+
+
+def run_many(juju: jubilant.Juju, n: int):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n * 2) as executor:
+        futures = [executor.submit(juju.cli, 'status') for _ in range(n)]
+        futures += [executor.submit(juju.cli, 'deploy', 'x') for _ in range(n)]
+        for future in futures:
+            future.result()
+
+
+def test_no_limits():
+    transport = CountingTransport()
+    juju = jubilant.Juju(transport=transport)
+
+    run_many(juju, 8)
+
+    assert transport.max_running['read'] > 2
+
+
+def test_limits():
+    jubilant.limit_concurrency(read=2, write=1)
+    transport = CountingTransport()
+    juju = jubilant.Juju(transport=transport)
+
+    run_many(juju, 8)
+
+    assert transport.max_running == {'read': 2, 'write': 1}
+
+
+def test_lock_dir(tmp_path: pathlib.Path):
+    jubilant.limit_concurrency(read=3, lock_dir=tmp_path / 'locks')
+    transport = CountingTransport()
+    juju = jubilant.Juju(transport=transport)
+
+    run_many(juju, 8)
+
+    assert transport.max_running['read'] == 3
+    assert sorted(p.name for p in (tmp_path / 'locks').iterdir()) == [
+        'read-0.lock',
+        'read-1.lock',
+        'read-2.lock',
+    ]
+
+
+def test_lock_dir_shared(tmp_path: pathlib.Path):
+    # Simulate another process holding the only slot, using a separate _Slots instance.
+    slots = _limits._Slots('write', 1, str(tmp_path))
+    other = _limits._Slots('write', 1, str(tmp_path))
+    acquired = threading.Event()
+
+    def acquire_other():
+        with other.acquire():
+            acquired.set()
+
+    with slots.acquire():
+        thread = threading.Thread(target=acquire_other)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+    thread.join(timeout=5)
+    assert acquired.is_set()
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        jubilant.limit_concurrency(read=0)
+    with pytest.raises(ValueError):
+        jubilant.limit_concurrency(write=-1)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+
+import pytest
+
+import jubilant
+
+from . import mocks
+from .fake_statuses import MINIMAL_JSON
+
+
+def test_collect(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'remove-unit', '--no-prompt', 'x/0'], returncode=1, stderr='no unit')
+    juju = jubilant.Juju()
+
+    with jubilant.collect_metrics() as metrics:
+        juju.status()
+        juju.wait(lambda _: True, successes=2)
+        with pytest.raises(jubilant.CLIError):
+            juju.remove_unit('x/0')
+
+    assert [e.command for e in metrics.commands] == ['status'] * 3 + ['remove-unit']
+    assert [e.in_wait for e in metrics.commands] == [False, True, True, False]
+    status_event = metrics.commands[0]
+    assert status_event.args == ('status', '--format', 'json')
+    assert status_event.returncode == 0
+    assert status_event.stdout_bytes == len(MINIMAL_JSON.encode())
+    assert metrics.commands[3].returncode == 1
+    assert metrics.commands[3].stderr_bytes == len('no unit')
+
+    # The second status in wait is unchanged, so isn't parsed again.
+    assert [(e.command, e.in_wait) for e in metrics.parses] == [
+        ('status', False),
+        ('status', True),
+    ]
+    assert metrics.end is not None
+
+
+def test_timeout(monkeypatch: pytest.MonkeyPatch):
+    def run(args: list[str], **kwargs: object):
+        raise subprocess.TimeoutExpired(args, 1)
+
+    monkeypatch.setattr('subprocess.run', run)
+    juju = jubilant.Juju()
+
+    with jubilant.collect_metrics() as metrics, pytest.raises(subprocess.TimeoutExpired):
+        juju._cli('status', timeout=1)
+
+    assert len(metrics.commands) == 1
+    assert metrics.commands[0].returncode is None
+
+
+def test_nested(run: mocks.Run):
+    run.handle(['juju', 'foo'])
+    run.handle(['juju', 'bar'])
+    juju = jubilant.Juju()
+
+    with jubilant.collect_metrics() as outer:
+        juju.cli('foo', include_model=False)
+        with jubilant.collect_metrics() as inner:
+            juju.cli('bar', include_model=False)
+    juju.cli('foo', include_model=False)
+
+    assert [e.command for e in outer.commands] == ['foo', 'bar']
+    assert [e.command for e in inner.commands] == ['bar']
+
+
+def test_summary():
+    metrics = jubilant.Metrics()
+    metrics.start = 0
+    metrics.end = 100
+    metrics.commands = [
+        jubilant.CommandEvent('status', ('status',), 0, 10, 0, 2_000_000, in_wait=True),
+        jubilant.CommandEvent('status', ('status',), 10, 20, 0, 3_000_000),
+        jubilant.CommandEvent('deploy', ('deploy', 'x'), 30, 40, 0),
+    ]
+    metrics.parses = [jubilant.ParseEvent('status', 10, 2)]
+
+    assert metrics.summary() == (
+        'Juju CLI: 3 calls, 70.0s (70% of 100.0s wall time)\n'
+        '  deploy: 1 calls, 40.0s (40%), 0 from wait, 0.0 MB stdout\n'
+        '  status: 2 calls, 30.0s (30%), 1 from wait, 5.0 MB stdout\n'
+        'Parsing: status: 1 calls, 2.0s (2%)'
+    )
+
+
+def test_chrome_trace(
+    run: mocks.Run, time: mocks.Time, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    monkeypatch.setattr('secrets.token_hex', lambda n: 'abcd1234')  # type: ignore
+    run.handle(['juju', 'add-model', '--no-switch', 'jubilant-abcd1234'])
+    run.handle(['juju', 'deploy', '--model', 'jubilant-abcd1234', 'app1'])
+    run.handle(
+        ['juju', 'status', '--model', 'jubilant-abcd1234', '--format', 'json'],
+        stdout=MINIMAL_JSON,
+    )
+    run.handle([
+        'juju',
+        'destroy-model',
+        'jubilant-abcd1234',
+        '--no-prompt',
+        '--destroy-storage',
+        '--force',
+    ])
+    path = tmp_path / 'trace.json'
+
+    with jubilant.collect_metrics() as metrics:
+        with jubilant.temp_model() as juju:
+            juju.deploy('app1')
+            juju.wait(lambda _: True, successes=2)
+        metrics.write_chrome_trace(path)
+
+    trace = json.loads(path.read_text())
+    events = trace['traceEvents']
+    assert sorted((e['name'], e['cat'], e['ts'], e['dur']) for e in events) == sorted([
+        ('temp_model', 'model', 0, 1e6),
+        ('juju add-model', 'cli', 0, 0),
+        ('deploy', 'deploy', 0, 0),
+        ('juju deploy', 'cli', 0, 0),
+        ('wait', 'wait', 0, 1e6),
+        ('juju status', 'cli', 0, 0),
+        ('parse status', 'parse', 0, 0),
+        ('poll', 'wait', 0, 0),
+        ('juju status', 'cli', 1e6, 0),
+        ('poll', 'wait', 1e6, 0),
+        ('juju destroy-model', 'cli', 1e6, 0),
+    ])
+    assert [e['ts'] for e in events] == sorted(e['ts'] for e in events)
+    assert all(e['ph'] == 'X' for e in events)
+    by_name = {e['name']: e for e in events}
+    assert by_name['temp_model']['args'] == {'model': 'jubilant-abcd1234'}
+    assert by_name['deploy']['args'] == {'charm': 'app1', 'app': None}
+    assert by_name['juju deploy']['args']['command'] == 'deploy --model jubilant-abcd1234 app1'
+    assert [e['args']['changed'] for e in events if e['name'] == 'poll'] == [True, False]
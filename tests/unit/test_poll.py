@@ -0,0 +1,32 @@
+import pytest
+
+import jubilant
+
+
+def test_exponential_backoff():
+    schedule = jubilant.exponential_backoff(0.5, factor=3, max_delay=10)
+
+    delays = [schedule(polls, 0) for polls in range(1, 6)]
+
+    assert delays == [0.5, 1.5, 4.5, 10, 10]
+
+
+def test_exponential_backoff_long_wait():
+    schedule = jubilant.exponential_backoff()
+
+    assert schedule(100_000, 0) == 10
+
+
+def test_adaptive_delay():
+    schedule = jubilant.adaptive_delay(1, 5)
+
+    delays = [schedule(polls, unchanged) for polls, unchanged in enumerate([0, 1, 2, 3, 0], 1)]
+
+    assert delays == [1, 2, 4, 5, 1]
+
+
+def test_jitter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('random.uniform', lambda a, b: b)  # type: ignore
+    schedule = jubilant.exponential_backoff(2, jitter=0.25)
+
+    assert schedule(1, 0) == 2.5
@@ -4,6 +4,7 @@ import logging
 import pytest
 
 import jubilant
+from jubilant import _pretty
 
 from .fake_statuses import DATABASE_WEBAPP_JSON, MINIMAL_STATUS, SNAPPASS_JSON
 
@@ -384,8 +385,47 @@ def test_status_diff():
 - .apps['database'].app_status.current = 'active'
 + .apps['database'].app_status.current = 'waiting'
 - .apps['database'].relations['db'][0].scope = 'global'
++ .apps['database'].relations['db'][0].scope = 'testy'
 - .apps['database'].relations['db'][1].related_app = 'dummy'
 - .apps['database'].relations['db'][1].interface = 'xyz'
-- .apps['database'].relations['db'][1].scope = 'foobar'
-+ .apps['database'].relations['db'][0].scope = 'testy'"""
+- .apps['database'].relations['db'][1].scope = 'foobar'"""
     )
+
+
+def test_gron_diff_added_and_removed():
+    old_status = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+    new_json = json.loads(SNAPPASS_JSON)
+    app = new_json['applications']['snappass-test']
+    app['units']['snappass-test/1'] = app['units'].pop('snappass-test/0')
+    app['application-status']['message'] = ''  # back to the field's default
+    new_status = jubilant.Status._from_dict(new_json)
+
+    lines = list(_pretty.gron_diff(old_status, new_status))
+
+    assert "- .apps['snappass-test'].app_status.message = 'snappass started'" in lines
+    assert not any(line.startswith("+ .apps['snappass-test'].app_status") for line in lines)
+    assert any(
+        line.startswith("- .apps['snappass-test'].units['snappass-test/0'].") for line in lines
+    )
+    assert any(
+        line.startswith("+ .apps['snappass-test'].units['snappass-test/1'].") for line in lines
+    )
+    # Sorted by key, so removals of unit 0 come before additions of unit 1.
+    unit_lines = [line for line in lines if '.units[' in line]
+    assert unit_lines == sorted(unit_lines, key=lambda line: 'snappass-test/1' in line)
+
+
+def test_gron_diff_same():
+    status = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+    same = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+
+    assert list(_pretty.gron_diff(status, same)) == []
+    assert list(_pretty.gron_diff(status, status)) == []
+
+
+def test_gron_diff_lists():
+    assert list(_pretty.gron_diff([1, 2], [1, 3, 4], 'x')) == [
+        '- x[1] = 2',
+        '+ x[1] = 3',
+        '+ x[2] = 4',
+    ]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+import jubilant
+
+from . import mocks
+from .fake_statuses import MINIMAL_JSON
+
+TRANSIENT = 'ERROR cannot connect to API: connection is shut down'
+
+
+def fixed(delay: float) -> jubilant.DelaySchedule:
+    def schedule(polls: int, unchanged: int) -> float:
+        return delay
+
+    return schedule
+
+
+class FlakyRun(mocks.Run):
+    """Mock subprocess.run that fails with the given stderr before succeeding."""
+
+    def __init__(self, failures: int, stderr: str = TRANSIENT):
+        super().__init__()
+        self.failures = failures
+        self.stderr = stderr
+
+    def __call__(self, args: list[str], *pargs: object, **kwargs: object):
+        handler = self._commands[tuple(args)]
+        if self.failures:
+            self.failures -= 1
+            self._commands[tuple(args)] = (1, '', self.stderr)
+        try:
+            return super().__call__(args, *pargs, **kwargs)  # type: ignore
+        finally:
+            self._commands[tuple(args)] = handler
+
+
+@pytest.fixture
+def flaky(monkeypatch: pytest.MonkeyPatch) -> FlakyRun:
+    run = FlakyRun(failures=2)
+    monkeypatch.setattr('subprocess.run', run)
+    return run
+
+
+def test_retry_read(flaky: FlakyRun, time: mocks.Time, caplog: pytest.LogCaptureFixture):
+    flaky.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy(backoff=fixed(2)))
+
+    with jubilant.collect_metrics() as metrics:
+        status = juju.status()
+
+    assert status.model.name == 'mdl'
+    assert [c.returncode for c in flaky.calls] == [1, 1, 0]
+    assert time.monotonic() == 4
+    assert [e.attempt for e in metrics.commands] == [1, 2, 3]
+    assert 'Retries: 2 (status: 2)' in metrics.summary()
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 2
+    assert 'connection is shut down' in warnings[0].getMessage()
+
+
+def test_no_policy(flaky: FlakyRun):
+    flaky.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+
+    with pytest.raises(jubilant.CLIError):
+        juju.status()
+    assert len(flaky.calls) == 1
+
+
+def test_max_attempts(flaky: FlakyRun, time: mocks.Time):
+    flaky.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy(max_attempts=2, backoff=fixed(1)))
+
+    with pytest.raises(jubilant.CLIError):
+        juju.status()
+    assert len(flaky.calls) == 2
+
+
+def test_deadline(flaky: FlakyRun, time: mocks.Time):
+    flaky.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy(backoff=fixed(10), deadline=15))
+
+    with pytest.raises(jubilant.CLIError):
+        juju.status()
+    assert len(flaky.calls) == 2
+    assert time.monotonic() == 10
+
+
+def test_write_not_retried(flaky: FlakyRun, time: mocks.Time):
+    flaky.handle(['juju', 'deploy', 'app'])
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy())
+
+    with pytest.raises(jubilant.CLIError):
+        juju.deploy('app')
+    assert len(flaky.calls) == 1
+
+
+def test_commands(flaky: FlakyRun, time: mocks.Time):
+    flaky.handle(['juju', 'deploy', 'app'])
+    flaky.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy(commands={'deploy'}, backoff=fixed(1)))
+
+    juju.deploy('app')
+    assert len(flaky.calls) == 3
+
+    flaky.failures = 1
+    with pytest.raises(jubilant.CLIError):
+        juju.status()
+
+
+def test_other_error_not_retried(monkeypatch: pytest.MonkeyPatch, time: mocks.Time):
+    run = FlakyRun(failures=1, stderr='ERROR model "x" not found')
+    monkeypatch.setattr('subprocess.run', run)
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(retry=jubilant.RetryPolicy())
+
+    with pytest.raises(jubilant.CLIError):
+        juju.status()
+    assert len(run.calls) == 1
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Collection
+
+import pytest
+import yaml
+
+import jubilant
+
+from . import mocks
+
+
+def _task_json(*units: str, failed: Collection[str] = ()) -> str:
+    results = {
+        unit: {
+            'id': str(i),
+            'results': {'return-code': 1 if unit in failed else 0},
+            'status': 'failed' if unit in failed else 'completed',
+        }
+        for i, unit in enumerate(units)
+    }
+    return json.dumps(results)
+
+
+def test_completed(run: mocks.Run):
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'mysql/0', 'mysql/1', 'rotate'],
+        stdout=_task_json('mysql/0', 'mysql/1'),
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.run_multiple(['mysql/0', 'mysql/1'], 'rotate')
+
+    assert tasks == {
+        'mysql/0': jubilant.Task(id='0', status='completed'),
+        'mysql/1': jubilant.Task(id='1', status='completed'),
+    }
+    assert len(run.calls) == 1
+
+
+def test_failed(run: mocks.Run):
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'mysql/0', 'mysql/1', 'rotate'],
+        returncode=1,
+        stdout=_task_json('mysql/0', 'mysql/1', failed=['mysql/1']),
+        stderr='task failed',
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.run_multiple(['mysql/0', 'mysql/1'], 'rotate')
+
+    assert tasks['mysql/0'].success
+    assert not tasks['mysql/1'].success
+
+
+def test_several_failed(run: mocks.Run):
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'mysql/0', 'mysql/1', 'mysql/2', 'rotate'],
+        returncode=1,
+        stdout=_task_json('mysql/0', 'mysql/1', 'mysql/2', failed=['mysql/0', 'mysql/2']),
+        stderr='ERROR the following tasks failed:\n - id "0" with return code 1\n'
+        ' - id "2" with return code 1\n\nuse \'juju show-task\' to inspect the failures\n',
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.run_multiple(['mysql/0', 'mysql/1', 'mysql/2'], 'rotate')
+
+    assert not tasks['mysql/0'].success
+    assert tasks['mysql/1'].success
+    assert not tasks['mysql/2'].success
+
+
+def test_chunked(
+    run: mocks.Run, mock_file: mocks.NamedTemporaryFile, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr('jubilant._juju._MAX_UNITS_PER_RUN', 2)
+    params_args = ['--wait', '5s', '--params', mock_file.name]
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'a/0', 'a/1', 'rotate', *params_args],
+        stdout=_task_json('a/0', 'a/1'),
+    )
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'a/2', 'rotate', *params_args],
+        stdout=_task_json('a/2'),
+    )
+    juju = jubilant.Juju()
+
+    tasks = juju.run_multiple(['a/0', 'a/1', 'a/2'], 'rotate', {'n': 1}, wait=5)
+
+    assert list(tasks) == ['a/0', 'a/1', 'a/2']
+    assert len(run.calls) == 2
+    # The params file is written once and shared by all the "juju run" commands.
+    assert yaml.safe_load('\n'.join(mock_file.writes)) == {'n': 1}
+    assert mock_file.num_flushes == 1
+
+
+def test_not_found(run: mocks.Run):
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'mysql/0', 'mysql/1', 'undefined'],
+        returncode=1,
+        stderr='ERROR action "undefined" not defined for unit "mysql/0". (not found)',
+    )
+    juju = jubilant.Juju()
+
+    with pytest.raises(ValueError):
+        juju.run_multiple(['mysql/0', 'mysql/1'], 'undefined')
+
+
+def test_timeout(run: mocks.Run):
+    run.handle(
+        ['juju', 'run', '--format', 'json', 'mysql/0', 'mysql/1', 'rotate', '--wait', '1s'],
+        returncode=1,
+        stderr='timed out',
+    )
+    juju = jubilant.Juju()
+
+    with pytest.raises(TimeoutError):
+        juju.run_multiple(['mysql/0', 'mysql/1'], 'rotate', wait=1)
+
+
+def test_type_errors():
+    juju = jubilant.Juju()
+    with pytest.raises(TypeError):
+        juju.run_multiple('mysql/0', 'rotate')
+    with pytest.raises(TypeError):
+        juju.run_multiple([], 'rotate')
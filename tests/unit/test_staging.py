@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import subprocess
+
+import pytest
+
+import jubilant
+from jubilant import _staging
+
+
+@pytest.fixture
+def cache_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / 'cache'
+
+
+def test_stage(tmp_path: pathlib.Path, cache_dir: pathlib.Path):
+    src = tmp_path / 'my.charm'
+    src.write_text('CH')
+
+    _staging.stage(str(src), str(tmp_path / 'a.charm'), str(cache_dir))
+    _staging.stage(str(src), str(tmp_path / 'b.charm'), str(cache_dir))
+
+    entry = cache_dir / hashlib.sha256(b'CH').hexdigest()
+    assert os.listdir(cache_dir) == [entry.name]
+    assert (tmp_path / 'a.charm').read_text() == 'CH'
+    assert (tmp_path / 'a.charm').stat().st_ino == entry.stat().st_ino
+    assert (tmp_path / 'b.charm').stat().st_ino == entry.stat().st_ino
+    # The source is copied into the cache, not linked, so rebuilding it can't change the cache.
+    assert src.stat().st_ino != entry.stat().st_ino
+
+
+def test_same_contents(tmp_path: pathlib.Path, cache_dir: pathlib.Path):
+    (tmp_path / 'x').write_text('SAME')
+    (tmp_path / 'y').write_text('SAME')
+
+    _staging.stage(str(tmp_path / 'x'), str(tmp_path / 'x2'), str(cache_dir))
+    _staging.stage(str(tmp_path / 'y'), str(tmp_path / 'y2'), str(cache_dir))
+
+    assert len(os.listdir(cache_dir)) == 1
+    assert (tmp_path / 'x2').stat().st_ino == (tmp_path / 'y2').stat().st_ino
+
+
+def test_changed_source(tmp_path: pathlib.Path, cache_dir: pathlib.Path):
+    src = tmp_path / 'my.charm'
+    src.write_text('V1')
+    _staging.stage(str(src), str(tmp_path / 'a'), str(cache_dir))
+
+    src.write_text('VERSION2')
+    _staging.stage(str(src), str(tmp_path / 'b'), str(cache_dir))
+
+    assert (tmp_path / 'a').read_text() == 'V1'
+    assert (tmp_path / 'b').read_text() == 'VERSION2'
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_hash_reused(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, cache_dir: pathlib.Path
+):
+    src = tmp_path / 'my.charm'
+    src.write_text('CH')
+    _staging.stage(str(src), str(tmp_path / 'a'), str(cache_dir))
+
+    def sha256():
+        raise AssertionError('unchanged file was hashed again')
+
+    monkeypatch.setattr('hashlib.sha256', sha256)
+    _staging.stage(str(src), str(tmp_path / 'b'), str(cache_dir))
+
+    assert (tmp_path / 'b').read_text() == 'CH'
+
+
+def test_link_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, cache_dir: pathlib.Path
+):
+    def link(src: str, dst: str):
+        raise OSError(18, 'Invalid cross-device link')
+
+    monkeypatch.setattr('os.link', link)
+    src = tmp_path / 'my.charm'
+    src.write_text('CH')
+
+    _staging.stage(str(src), str(tmp_path / 'a'), str(cache_dir))
+
+    assert (tmp_path / 'a').read_text() == 'CH'
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_evict(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, cache_dir: pathlib.Path):
+    monkeypatch.setattr(_staging, '_MAX_CACHE_BYTES', 10)
+    for name in ['a', 'b', 'c']:
+        (tmp_path / name).write_text(name * 5)
+
+    def entry(name: str) -> pathlib.Path:
+        return cache_dir / hashlib.sha256(name.encode() * 5).hexdigest()
+
+    _staging.stage(str(tmp_path / 'a'), str(tmp_path / 'a1'), str(cache_dir))
+    _staging.stage(str(tmp_path / 'b'), str(tmp_path / 'b1'), str(cache_dir))
+    os.utime(entry('a'), (1000, 1000))
+    os.utime(entry('b'), (1001, 1001))
+    # Using "a" again makes "b" the least recently used.
+    _staging.stage(str(tmp_path / 'a'), str(tmp_path / 'a2'), str(cache_dir))
+    _staging.stage(str(tmp_path / 'c'), str(tmp_path / 'c1'), str(cache_dir))
+
+    assert sorted(os.listdir(cache_dir)) == sorted([entry('a').name, entry('c').name])
+    # Staged files are still usable after their cache entry is evicted.
+    assert (tmp_path / 'b1').read_text() == 'bbbbb'
+
+
+def test_deploy_reuses_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr('shutil.which', lambda _: '/snap/bin/juju')  # type: ignore
+    monkeypatch.setattr('os.path.expanduser', lambda _: str(tmp_path / 'common'))  # type: ignore
+    (tmp_path / 'my.charm').write_text('CH')
+
+    inodes: list[int] = []
+
+    def check_charm(args: list[str], **_: object):
+        inodes.append(pathlib.Path(args[2]).stat().st_ino)
+        return subprocess.CompletedProcess(args, 0, '', '')
+
+    monkeypatch.setattr('subprocess.run', check_charm)
+    jubilant.Juju().deploy(tmp_path / 'my.charm')
+    jubilant.Juju().deploy(tmp_path / 'my.charm', 'app2')
+
+    assert len(inodes) == 2
+    assert inodes[0] == inodes[1]
+    assert os.listdir(tmp_path / 'common' / '.jubilant-staging') == [
+        hashlib.sha256(b'CH').hexdigest()
+    ]
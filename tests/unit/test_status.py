@@ -1,4 +1,9 @@
 import dataclasses
+import subprocess
+import threading
+from typing import Any
+
+import pytest
 
 import jubilant
 from jubilant import statustypes
@@ -25,6 +30,16 @@ def test_minimal_with_model(run: mocks.Run):
     assert status == MINIMAL_STATUS
 
 
+def test_apps(run: mocks.Run):
+    run.handle(['juju', 'status', '--format', 'json', 'mysql'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'status', '--format', 'json', 'mysql', 'blog'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+
+    assert juju.status(apps='mysql') == MINIMAL_STATUS
+    assert juju.status(apps=['mysql', 'blog']) == MINIMAL_STATUS
+    assert len(run.calls) == 2
+
+
 def test_real_status(run: mocks.Run):
     run.handle(['juju', 'status', '--format', 'json'], stdout=SNAPPASS_JSON)
     juju = jubilant.Juju()
@@ -50,3 +65,129 @@ def test_status_eq():
     )
     assert status1 == status1b
     assert status1 == status2
+
+
+def test_status_ttl(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'status', '--format', 'json', 'mysql'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(status_ttl=5)
+
+    status1 = juju.status()
+    status2 = juju.status()
+    assert status2 is status1
+    assert len(run.calls) == 1
+
+    # Filtered statuses are cached separately.
+    juju.status(apps='mysql')
+    assert len(run.calls) == 2
+
+    time.sleep(5)
+    status3 = juju.status()
+    assert status3 is not status1
+    assert len(run.calls) == 3
+
+
+def test_status_ttl_invalidated(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'show-unit', 'mysql/0', '--format', 'json'], stdout='{"mysql/0": {}}')
+    run.handle(['juju', 'remove-unit', '--no-prompt', 'mysql/0'])
+    juju = jubilant.Juju(status_ttl=60)
+
+    juju.status()
+    juju.cli('show-unit', 'mysql/0', '--format', 'json')
+    juju.status()
+    assert len(run.calls) == 2
+
+    juju.remove_unit('mysql/0')
+    juju.status()
+    assert len(run.calls) == 4
+
+
+def test_status_ttl_model_changed(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--model', 'a', '--format', 'json'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'status', '--model', 'b', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(model='a', status_ttl=60)
+
+    status_a = juju.status()
+    juju.model = 'b'
+    status_b = juju.status()
+    assert status_b is not status_a
+    assert len(run.calls) == 2
+
+    juju.model = 'a'
+    assert juju.status() is status_a
+    assert len(run.calls) == 2
+
+
+def test_status_ttl_concurrent_change(monkeypatch: pytest.MonkeyPatch):
+    deploy_started = threading.Event()
+    finish_deploy = threading.Event()
+    status_calls = 0
+
+    def mock_run(args: list[str], **_: Any):
+        nonlocal status_calls
+        if args[1] == 'deploy':
+            deploy_started.set()
+            assert finish_deploy.wait(timeout=5)
+            return subprocess.CompletedProcess(args, 0, '', '')
+        status_calls += 1
+        return subprocess.CompletedProcess(args, 0, MINIMAL_JSON, '')
+
+    monkeypatch.setattr('subprocess.run', mock_run)
+    juju = jubilant.Juju(status_ttl=60)
+
+    thread = threading.Thread(target=juju.deploy, args=('mysql',))
+    thread.start()
+    assert deploy_started.wait(timeout=5)
+    # Fetched while the deploy is still running, so may not reflect its changes.
+    juju.status()
+    finish_deploy.set()
+    thread.join()
+
+    juju.status()
+    assert status_calls == 2
+    juju.status()
+    assert status_calls == 2
+
+
+def test_status_ttl_change_during_fetch(monkeypatch: pytest.MonkeyPatch):
+    juju = jubilant.Juju(status_ttl=60)
+    status_calls = 0
+
+    def mock_run(args: list[str], **_: Any):
+        nonlocal status_calls
+        if args[1] == 'status':
+            status_calls += 1
+            if status_calls == 1:
+                # A change made (in full) while the first status is being fetched.
+                juju.cli('config', 'mysql', 'x=1')
+            return subprocess.CompletedProcess(args, 0, MINIMAL_JSON, '')
+        return subprocess.CompletedProcess(args, 0, '', '')
+
+    monkeypatch.setattr('subprocess.run', mock_run)
+
+    juju.status()
+    juju.status()
+    assert status_calls == 2
+    juju.status()
+    assert status_calls == 2
+
+
+def test_status_ttl_wait(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju(status_ttl=60)
+
+    status = juju.wait(lambda _: True, successes=1)
+
+    assert juju.status() is status
+    assert len(run.calls) == 1
+
+
+def test_no_status_ttl(run: mocks.Run):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+
+    juju.status()
+    juju.status()
+
+    assert len(run.calls) == 2
@@ -2,7 +2,7 @@ import json
 
 import jubilant
 
-from .fake_statuses import STATUS_ERRORS_JSON, SUBORDINATES_JSON
+from .fake_statuses import SNAPPASS_JSON, STATUS_ERRORS_JSON, SUBORDINATES_JSON
 
 
 def test_juju_status_error():
@@ -62,3 +62,56 @@ def test_get_units():
     assert units['nrpe/2'].public_address == '10.103.56.129'
 
     assert status.get_units('foo') == {}
+
+
+def test_diff():
+    old_json = json.loads(SNAPPASS_JSON)
+    new_json = json.loads(SNAPPASS_JSON)
+    unit = new_json['applications']['snappass-test']['units']['snappass-test/0']
+    unit['workload-status']['current'] = 'error'
+    new_json['applications']['other'] = new_json['applications']['snappass-test']
+    new_json['controller'] = {'timestamp': 'changed'}
+    old = jubilant.Status._from_dict(old_json)
+    new = jubilant.Status._from_dict(new_json)
+
+    changes = list(old.diff(new))
+
+    assert changes == [
+        jubilant.statustypes.StatusChange(
+            path=('apps', 'other'),
+            old=None,
+            new=new.apps['other'],
+        ),
+        jubilant.statustypes.StatusChange(
+            path=(
+                'apps',
+                'snappass-test',
+                'units',
+                'snappass-test/0',
+                'workload_status',
+                'current',
+            ),
+            old='active',
+            new='error',
+        ),
+    ]
+
+
+def test_diff_equal():
+    status = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+    same = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+
+    assert list(status.diff(same)) == []
+    assert list(status.diff(status)) == []
+
+
+def test_slots():
+    # Status objects for large models are kept around in Juju.wait, so the dataclasses
+    # use __slots__ to avoid the memory overhead of a __dict__ per instance.
+    status = jubilant.Status._from_dict(json.loads(SNAPPASS_JSON))
+    unit = status.apps['snappass-test'].units['snappass-test/0']
+
+    for obj in [status, status.model, status.apps['snappass-test'], unit, unit.workload_status]:
+        assert not hasattr(obj, '__dict__')
+    for name in jubilant.statustypes.__all__:
+        assert '__slots__' in vars(getattr(jubilant.statustypes, name))
@@ -1,3 +1,5 @@
+import itertools
+import json
 import logging
 import subprocess
 from typing import Any
@@ -156,3 +158,171 @@ def test_destroy_timeout(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCapt
         pass
 
     assert 'timeout destroying model' in caplog.records[0].getMessage()
+
+
+def mock_token_hex_counter():
+    counter = itertools.count()
+
+    def token_hex(n: int):
+        assert n == 4
+        return f'{next(counter):08x}'
+
+    return token_hex
+
+
+def destroy_args(model: str) -> list[str]:
+    return ['juju', 'destroy-model', model, '--no-prompt', '--destroy-storage', '--force']
+
+
+def test_pool(run: mocks.Run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex_counter())
+    for i in range(4):
+        run.handle(['juju', 'add-model', '--no-switch', f'jubilant-{i:08x}', '--controller', 'c'])
+        run.handle(destroy_args(f'c:jubilant-{i:08x}'))
+        run.handle(['juju', 'deploy', '--model', f'c:jubilant-{i:08x}', 'app1'])
+
+    # The pool creates models in parallel, so the order they're handed out in isn't fixed.
+    used: list[str | None] = []
+    with jubilant.ModelPool(size=2, controller='c') as pool:
+        with jubilant.temp_model(pool=pool) as juju:
+            used.append(juju.model)
+            juju.deploy('app1')
+        with jubilant.temp_model(pool=pool) as juju:
+            used.append(juju.model)
+
+    assert len(set(used)) == 2
+    assert set(used) <= {f'c:jubilant-{i:08x}' for i in range(4)}
+    assert juju.model is None
+    added = sorted(c.args[3] for c in run.calls if c.args[1] == 'add-model')
+    destroyed = sorted(c.args[2] for c in run.calls if c.args[1] == 'destroy-model')
+    # Two models were used, and two replacements were created; all four are destroyed.
+    assert added == [f'jubilant-{i:08x}' for i in range(4)]
+    assert destroyed == [f'c:jubilant-{i:08x}' for i in range(4)]
+
+
+def test_pool_keep(run: mocks.Run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex_counter())
+    for i in range(2):
+        run.handle(['juju', 'add-model', '--no-switch', f'jubilant-{i:08x}'])
+    run.handle(destroy_args('jubilant-00000001'))
+
+    with jubilant.ModelPool(size=1) as pool, jubilant.temp_model(keep=True, pool=pool) as juju:
+        pass
+
+    assert juju.model == 'jubilant-00000000'
+    destroyed = [c.args[2] for c in run.calls if c.args[1] == 'destroy-model']
+    assert destroyed == ['jubilant-00000001']
+
+
+def test_pool_add_error(run: mocks.Run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex)
+    run.handle(['juju', 'add-model', '--no-switch', 'jubilant-abcd1234'], returncode=1)
+
+    with jubilant.ModelPool(size=1) as pool, pytest.raises(jubilant.CLIError):
+        pool.get()
+
+
+def test_pool_type_error(run: mocks.Run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex)
+    run.handle(['juju', 'add-model', '--no-switch', 'jubilant-abcd1234'])
+    run.handle(destroy_args('jubilant-abcd1234'))
+
+    with (
+        jubilant.ModelPool(size=1) as pool,
+        pytest.raises(TypeError),
+        jubilant.temp_model(controller='c', pool=pool),
+    ):
+        pass
+
+
+def test_reaper(run: mocks.Run, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex_counter())
+    for i in range(3):
+        run.handle(['juju', 'add-model', '--no-switch', f'jubilant-{i:08x}'])
+    run.handle(destroy_args('jubilant-00000000'))
+    run.handle(destroy_args('jubilant-00000001'), returncode=1, stderr='ERROR model is busy\n')
+    run.handle(destroy_args('jubilant-00000002'))
+    caplog.set_level(logging.INFO, logger='jubilant')
+
+    reaper = jubilant.ModelReaper()
+    jujus: list[jubilant.Juju] = []
+    for _ in range(3):
+        with jubilant.temp_model(reaper=reaper) as juju:
+            jujus.append(juju)
+    failed = reaper.join()
+
+    assert list(failed) == ['jubilant-00000001']
+    assert failed['jubilant-00000001'].endswith('ERROR model is busy')
+    destroyed = sorted(c.args[2] for c in run.calls if c.args[1] == 'destroy-model')
+    assert destroyed == [f'jubilant-{i:08x}' for i in range(3)]
+    assert [juju.model for juju in jujus] == [None, 'jubilant-00000001', None]
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(errors) == 1
+    assert errors[0].startswith('failed to destroy 1 of 3 models:\n  jubilant-00000001: ')
+
+
+def test_reaper_timeout(monkeypatch: pytest.MonkeyPatch):
+    def mock_run(args: 'list[str]', **kwargs: 'dict[str, Any]'):
+        raise subprocess.TimeoutExpired(args, 10 * 60)
+
+    monkeypatch.setattr('subprocess.run', mock_run)
+
+    with jubilant.ModelReaper() as reaper:
+        reaper.destroy(jubilant.Juju(model='m'))
+
+    assert reaper.join() == {'m': 'timed out after 600s'}
+
+
+def test_reaper_type_error(run: mocks.Run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('secrets.token_hex', mock_token_hex)
+    run.handle(['juju', 'add-model', '--no-switch', 'jubilant-abcd1234'])
+    run.handle(destroy_args('jubilant-abcd1234'))
+
+    with (
+        jubilant.ModelReaper() as reaper,
+        jubilant.ModelPool(size=1) as pool,
+        pytest.raises(TypeError),
+        jubilant.temp_model(pool=pool, reaper=reaper),
+    ):
+        pass
+
+
+@pytest.fixture
+def select_calls(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr('jubilant._test_helpers._select_calls', itertools.count())
+    monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+
+
+@pytest.mark.usefixtures('select_calls')
+def test_select_controller_round_robin(monkeypatch: pytest.MonkeyPatch):
+    controllers = ['a', 'b', 'c']
+
+    assert [jubilant.select_controller(controllers) for _ in range(4)] == ['a', 'b', 'c', 'a']
+
+    monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw4')
+    assert jubilant.select_controller(controllers) == 'c'  # (4 + 4) % 3
+    assert jubilant.select_controller(controllers, worker_id='gw0') == 'c'  # (0 + 5) % 3
+
+
+@pytest.mark.usefixtures('select_calls')
+def test_select_controller_least_loaded(run: mocks.Run):
+    def models(n: int) -> str:
+        return json.dumps({'models': [{'name': f'm{i}'} for i in range(n)]})
+
+    run.handle(['juju', 'models', '--controller', 'a', '--format', 'json'], stdout=models(3))
+    run.handle(['juju', 'models', '--controller', 'b', '--format', 'json'], stdout=models(1))
+    run.handle(['juju', 'models', '--controller', 'c', '--format', 'json'], stdout=models(1))
+
+    # Ties are broken according to the worker ID.
+    assert jubilant.select_controller(['a', 'b', 'c'], strategy='least-loaded') == 'b'
+    selected = jubilant.select_controller(
+        ['a', 'b', 'c'], strategy='least-loaded', worker_id='gw1'
+    )
+    assert selected == 'c'
+
+
+def test_select_controller_errors():
+    with pytest.raises(ValueError):
+        jubilant.select_controller([])
+    with pytest.raises(ValueError):
+        jubilant.select_controller(['a'], strategy='random')  # type: ignore
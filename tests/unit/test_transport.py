@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+
+import pytest
+
+import jubilant
+
+from . import mocks
+from .fake_statuses import MINIMAL_JSON, MINIMAL_STATUS
+
+
+class FakeTransport:
+    def __init__(self, returncode: int = 0, stdout: str = '', stderr: str = ''):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.calls: list[tuple[list[str], str | None, float | None]] = []
+
+    def run(
+        self, args: list[str], *, stdin: str | None = None, timeout: float | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        self.calls.append((args, stdin, timeout))
+        return subprocess.CompletedProcess(args, self.returncode, self.stdout, self.stderr)
+
+
+def test_custom_transport():
+    transport = FakeTransport(stdout='out')
+    juju = jubilant.Juju(model='m', transport=transport)
+
+    stdout = juju.cli('foo', 'bar', stdin='in')
+
+    assert stdout == 'out'
+    assert transport.calls == [(['juju', 'foo', '--model', 'm', 'bar'], 'in', None)]
+
+
+def test_custom_transport_error():
+    juju = jubilant.Juju(transport=FakeTransport(returncode=1, stdout='o', stderr='e'))
+
+    with pytest.raises(jubilant.CLIError) as excinfo:
+        juju.cli('foo')
+
+    assert excinfo.value.returncode == 1
+    assert excinfo.value.cmd == ['juju', 'foo']
+    assert excinfo.value.stdout == 'o'
+    assert excinfo.value.stderr == 'e'
+
+
+def test_subprocess_transport(run: mocks.Run):
+    run.handle(['juju', 'foo'], stdout='out', stderr='err')
+    run.handle(['juju', 'bad'], returncode=2, stdout='o', stderr='e')
+    transport = jubilant.SubprocessTransport()
+
+    process = transport.run(['juju', 'foo'], stdin='in', timeout=5)
+    assert (process.returncode, process.stdout, process.stderr) == (0, 'out', 'err')
+    assert run.calls[0].stdin == 'in'
+    assert run.calls[0].timeout == 5
+
+    process = transport.run(['juju', 'bad'])
+    assert (process.returncode, process.stdout, process.stderr) == (2, 'o', 'e')
+
+
+def test_record_replay(run: mocks.Run, time: mocks.Time, tmp_path: pathlib.Path):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    run.handle(['juju', 'remove-unit', '--no-prompt', 'x/0'], returncode=1, stderr='no unit')
+    path = tmp_path / 'transcript.jsonl'
+
+    juju = jubilant.Juju(transport=jubilant.RecordingTransport(path))
+    juju.wait(lambda _: True)
+    with pytest.raises(jubilant.CLIError):
+        juju.remove_unit('x/0')
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 4
+    assert lines[3] == {
+        'args': ['juju', 'remove-unit', '--no-prompt', 'x/0'],
+        'stdin': None,
+        'returncode': 1,
+        'stdout': '',
+        'stderr': 'no unit',
+    }
+
+    juju = jubilant.Juju(transport=jubilant.ReplayTransport(path))
+    # Only 3 status calls were recorded; the last one is repeated after that.
+    for _ in range(5):
+        assert juju.status() == MINIMAL_STATUS
+    with pytest.raises(jubilant.CLIError) as excinfo:
+        juju.remove_unit('x/0')
+    assert excinfo.value.stderr == 'no unit'
+    assert len(run.calls) == 4  # replaying doesn't run any commands
+
+
+def test_replay_order(tmp_path: pathlib.Path):
+    path = tmp_path / 'transcript.jsonl'
+    entries = [
+        {'args': ['juju', 'a'], 'stdin': None, 'returncode': 0, 'stdout': '1', 'stderr': ''},
+        {'args': ['juju', 'b'], 'stdin': None, 'returncode': 0, 'stdout': 'b', 'stderr': ''},
+        {'args': ['juju', 'a'], 'stdin': None, 'returncode': 0, 'stdout': '2', 'stderr': ''},
+    ]
+    path.write_text(''.join(json.dumps(e) + '\n' for e in entries))
+    juju = jubilant.Juju(transport=jubilant.ReplayTransport(path))
+
+    assert juju.cli('a') == '1'
+    assert juju.cli('a') == '2'
+    assert juju.cli('a') == '2'
+    assert juju.cli('b') == 'b'
+    with pytest.raises(ValueError):
+        juju.cli('c')
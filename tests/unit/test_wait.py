@@ -1,9 +1,12 @@
 import json
 import logging
+import subprocess
+from typing import Any
 
 import pytest
 
 import jubilant
+from jubilant import _juju
 
 from . import mocks
 from .fake_statuses import DATABASE_WEBAPP_JSON, MINIMAL_JSON, MINIMAL_STATUS, SNAPPASS_JSON
@@ -237,3 +240,173 @@ def test_timeout_zero(time: mocks.Time):
 
     assert time.monotonic() == 0
     assert 'mdl' not in str(excinfo.value)
+
+
+def test_watch(popen: mocks.Popen, time: mocks.Time):
+    popen.handle(
+        ['juju', 'status', '--model', 'mdl', '--format', 'json', '--watch', '1.0s'],
+        lines=['\x1b[H\x1b[2J' + MINIMAL_JSON.replace('\n', '') + '\n'] * 3,
+    )
+    juju = jubilant.Juju(model='mdl')
+
+    status = juju.wait(lambda _: True, watch=True)
+
+    assert status == MINIMAL_STATUS
+    assert len(popen.calls) == 1
+    # The watch process produces statuses at its own pace, so wait doesn't sleep.
+    assert time.monotonic() == 0
+    assert popen.processes[0].stdout.closed
+
+
+def test_watch_apps(popen: mocks.Popen, time: mocks.Time):
+    popen.handle(
+        ['juju', 'status', '--format', 'json', 'mysql', '--watch', '1.0s'],
+        lines=[MINIMAL_JSON.replace('\n', '') + '\n'] * 3,
+    )
+    juju = jubilant.Juju()
+
+    status = juju.wait(lambda _: True, watch=True, apps=['mysql'])
+
+    assert status == MINIMAL_STATUS
+
+
+def test_watch_stops_process(popen: mocks.Popen, time: mocks.Time):
+    popen.handle(
+        ['juju', 'status', '--format', 'json', '--watch', '0.5s'],
+        lines=[MINIMAL_JSON.replace('\n', '') + '\n'] * 2,
+        block=True,
+    )
+    juju = jubilant.Juju()
+
+    juju.wait(lambda _: True, delay=0.5, successes=2, watch=True)
+
+    assert popen.processes[0].terminated
+
+
+def test_watch_fallback(run: mocks.Run, popen: mocks.Popen, time: mocks.Time):
+    popen.handle(
+        ['juju', 'status', '--format', 'json', '--watch', '1.0s'],
+        returncode=2,
+        lines=['ERROR option provided but not defined: --watch\n'],
+    )
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+
+    status = juju.wait(lambda _: True, watch=True)
+
+    assert status == MINIMAL_STATUS
+    assert len(run.calls) == 3
+    assert time.monotonic() == 2
+
+
+def test_apps(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json', 'mysql', 'blog'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+
+    status = juju.wait(lambda _: True, apps=['mysql', 'blog'])
+
+    assert status == MINIMAL_STATUS
+    assert len(run.calls) == 3
+
+
+def test_delay_schedule(run: mocks.Run, time: mocks.Time):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    juju = jubilant.Juju()
+    calls: list[tuple[int, int]] = []
+
+    def schedule(polls: int, unchanged: int) -> float:
+        calls.append((polls, unchanged))
+        return polls * 10
+
+    with pytest.raises(TimeoutError):
+        juju.wait(lambda _: False, delay=schedule, timeout=60)
+
+    # Status never changes, so "unchanged" counts up after the first call.
+    assert calls == [(1, 0), (2, 1), (3, 2)]
+    assert time.monotonic() == 60
+
+
+def test_delay_subtracts_status_time(
+    run: mocks.Run, time: mocks.Time, monkeypatch: pytest.MonkeyPatch
+):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=MINIMAL_JSON)
+    sleeps: list[float] = []
+    original_run = run.__call__
+
+    def slow_run(*args: Any, **kwargs: Any):
+        time.sleep(0.25)  # each status call takes 0.25s
+        return original_run(*args, **kwargs)
+
+    def sleep(seconds: float):
+        sleeps.append(seconds)
+        time.sleep(seconds)
+
+    monkeypatch.setattr('subprocess.run', slow_run)
+    monkeypatch.setattr('jubilant._juju.time.sleep', sleep)
+    juju = jubilant.Juju()
+
+    juju.wait(lambda _: True)
+
+    assert sleeps == [0.75, 0.75]
+
+
+def test_unchanged_status_not_reparsed(time: mocks.Time, monkeypatch: pytest.MonkeyPatch):
+    outputs = [
+        MINIMAL_JSON,
+        MINIMAL_JSON.replace('"model"', '"controller": {"timestamp": "10:00:01Z"}, "model"'),
+        MINIMAL_JSON.replace('"model"', '"controller": {"timestamp": "10:00:02Z"}, "model"'),
+        MINIMAL_JSON.replace('"model"', '"controller": {"timestamp": "10:00:03Z"}, "model"'),
+    ]
+
+    def mock_run(args: list[str], **kwargs: Any):
+        return subprocess.CompletedProcess(args, 0, outputs.pop(0), '')
+
+    monkeypatch.setattr('subprocess.run', mock_run)
+    num_parsed = 0
+    original_from_dict = jubilant.Status._from_dict
+
+    def from_dict(d: dict[str, Any]) -> jubilant.Status:
+        nonlocal num_parsed
+        num_parsed += 1
+        return original_from_dict(d)
+
+    monkeypatch.setattr(jubilant.Status, '_from_dict', from_dict)
+    juju = jubilant.Juju()
+
+    status = juju.wait(lambda _: True, successes=4)
+
+    # First output has no timestamp, so the second must be parsed; after that only
+    # the timestamp changes.
+    assert num_parsed == 2
+    assert status == MINIMAL_STATUS
+    assert status.controller.timestamp == '10:00:03Z'
+
+
+def test_split_status_timestamp():
+    stdout = '{"model":{"name":"m"},"controller":{"timestamp":"15:04:05+00:00"}}'
+
+    key, timestamp = _juju._split_status_timestamp(stdout)
+
+    assert key == '{"model":{"name":"m"},"controller":{"timestamp":""}}'
+    assert timestamp == '15:04:05+00:00'
+    assert _juju._split_status_timestamp('{"model":{}}') == ('{"model":{}}', None)
+
+
+def test_diff_only_computed_for_debug(
+    run: mocks.Run,
+    time: mocks.Time,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    run.handle(['juju', 'status', '--format', 'json'], stdout=SNAPPASS_JSON)
+
+    def status_diff(*args: Any) -> str:
+        raise AssertionError('_status_diff should not be called')
+
+    monkeypatch.setattr('jubilant._juju._status_diff', status_diff)
+    caplog.set_level(logging.INFO, logger='jubilant.wait')
+    juju = jubilant.Juju()
+
+    juju.wait(lambda _: True)
+
+    assert len(caplog.records) == 2